@@ -5,8 +5,10 @@ in the original implementation.
 """
 
 import argparse
+import functools
 import sys
-from typing import Dict, Callable, Any
+from types import MappingProxyType
+from typing import Callable, Any, Mapping
 
 from ..core.config import AtlasConfig
 from ..utils.exceptions import AtlasExplorerError, ConfigurationError
@@ -36,6 +38,42 @@ def subcmd_configure(subparsers):
     parser.set_defaults(handler_function="configure")
 
 
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Create the main argument parser.
+    
+    Returns:
+        Configured argument parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="atlasexplorer",
+        description="Atlas Explorer Utility - Secure Performance Analysis",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  atlasexplorer configure              Configure API credentials
+  atlasexplorer configure --help       Show configuration options
+        """)
+    
+    subparsers = parser.add_subparsers(
+        title="Commands",
+        description="Available Atlas Explorer commands",
+        help="Use 'command --help' for command-specific help",
+        dest="command",
+        required=True
+    )
+    
+    # Configure command
+    configure_parser = subparsers.add_parser(
+        "configure",
+        help="Configure Atlas Explorer Cloud Access",
+        description="Interactive configuration of API credentials and settings"
+    )
+    configure_parser.set_defaults(handler_function="configure")
+    
+    return parser
+
+
 class AtlasExplorerCLI:
     """Secure command-line interface for Atlas Explorer.
     
@@ -43,11 +81,21 @@ class AtlasExplorerCLI:
     mechanism for handling CLI commands.
     """
     
-    def __init__(self):
-        """Initialize the CLI with available commands."""
-        self.commands: Dict[str, Callable[[Any], None]] = {
-            "configure": self.configure_command
-        }
+    # Command name -> handler method name. Read-only, so handlers can only be
+    # looked up by name and never swapped in at runtime.
+    _COMMANDS: Mapping[str, str] = MappingProxyType({
+        "configure": "configure_command",
+    })
+    
+    @functools.cached_property
+    def commands(self) -> Mapping[str, Callable[[Any], None]]:
+        """Read-only view of the available commands and their handlers.
+        
+        Built on first access and kept for the lifetime of the instance.
+        """
+        return MappingProxyType({
+            name: getattr(self, method) for name, method in self._COMMANDS.items()
+        })
     
     def run(self, args: argparse.Namespace) -> None:
         """Execute a command based on parsed arguments.
@@ -64,12 +112,12 @@ class AtlasExplorerCLI:
             print("Error: No command specified")
             sys.exit(1)
         
-        if handler_name not in self.commands:
+        if handler_name not in self._COMMANDS:
             print(f"Error: Unknown command '{handler_name}'")
             sys.exit(1)
         
         try:
-            self.commands[handler_name](args)
+            getattr(self, self._COMMANDS[handler_name])(args)
         except AtlasExplorerError as e:
             print(f"Error: {e}")
             sys.exit(1)
@@ -96,38 +144,15 @@ class AtlasExplorerCLI:
     
     @staticmethod
     def create_parser() -> argparse.ArgumentParser:
-        """Create the main argument parser.
+        """Return the main argument parser.
+        
+        The parser is built on first use and shared afterwards, so callers
+        must not add arguments to it.
         
         Returns:
             Configured argument parser
         """
-        parser = argparse.ArgumentParser(
-            prog="atlasexplorer",
-            description="Atlas Explorer Utility - Secure Performance Analysis",
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  atlasexplorer configure              Configure API credentials
-  atlasexplorer configure --help       Show configuration options
-            """)
-        
-        subparsers = parser.add_subparsers(
-            title="Commands",
-            description="Available Atlas Explorer commands",
-            help="Use 'command --help' for command-specific help",
-            dest="command",
-            required=True
-        )
-        
-        # Configure command
-        configure_parser = subparsers.add_parser(
-            "configure",
-            help="Configure Atlas Explorer Cloud Access",
-            description="Interactive configuration of API credentials and settings"
-        )
-        configure_parser.set_defaults(handler_function="configure")
-        
-        return parser
+        return _build_parser()
     
     @staticmethod
     def main() -> None:
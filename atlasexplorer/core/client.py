@@ -6,11 +6,22 @@ This module contains the AtlasExplorer class extracted from the monolithic atlas
 with modern Python patterns, type safety, and dependency injection.
 """
 
+import os
 import sys
+import copy
 import json
-from typing import Optional, Dict, Any, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
 
 from ..utils.exceptions import (
     AtlasExplorerError,
@@ -22,6 +33,203 @@ from ..core.config import AtlasConfig
 from ..core.constants import AtlasConstants
 
 
+def _build_retry() -> Retry:
+    """
+    Create the retry policy for transient gateway failures.
+    
+    Connection errors, read timeouts and 5xx responses are retried up to three
+    times with a short exponential backoff (0.25s, 0.5s, 1.0s). POST requests
+    such as ``createsignedurls`` are not idempotent, so they are only retried
+    when the connection could not be made. Authentication failures such as
+    401/403 are returned immediately. Once retries run out the last response
+    is handed back so ``raise_for_status`` reports it as usual.
+    
+    Returns:
+        Retry policy for the shared HTTP adapter
+    """
+    policy = dict(
+        total=3,
+        backoff_factor=0.25,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_jitter=0.1, **policy)
+    except TypeError:
+        # urllib3 < 2 has no jitter support
+        return Retry(**policy)
+
+
+def _build_session() -> requests.Session:
+    """
+    Create the pooled HTTP session shared by all client calls.
+    
+    Returns:
+        Session with a keep-alive, retrying connection pool mounted for
+        http and https
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_build_retry())
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _decode_json(resp: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+    need to catch the stdlib exception.
+    
+    Args:
+        resp: HTTP response with a JSON body
+        
+    Returns:
+        Decoded JSON value
+    """
+    content = getattr(resp, "content", None)
+    if orjson is not None and isinstance(content, (bytes, bytearray, memoryview)):
+        return orjson.loads(content)
+    return resp.json()
+
+
+# Longest part of a response body quoted in error messages; gateways can
+# answer with whole HTML error pages.
+_ERROR_TEXT_LIMIT = 512
+
+
+def _response_excerpt(response: requests.Response) -> str:
+    """
+    Return the response body for an error message, truncated if long.
+    
+    Args:
+        response: Failed HTTP response
+        
+    Returns:
+        Body text, cut to _ERROR_TEXT_LIMIT characters plus an ellipsis
+    """
+    text = response.text
+    if len(text) > _ERROR_TEXT_LIMIT:
+        return text[:_ERROR_TEXT_LIMIT] + "..."
+    return text
+
+
+# Module-wide so every AtlasExplorer instance and helper function reuses the
+# same open connections instead of paying a TCP+TLS handshake per request.
+_session = _build_session()
+
+
+class _TTLCache:
+    """
+    Small time-bounded cache for read-only API responses.
+    
+    Entries expire after their own TTL, measured on the monotonic clock.
+    When full, the oldest entry is evicted.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+        return value
+    
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds (ignored if ttl <= 0)."""
+        if ttl <= 0:
+            return
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl, value)
+    
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+
+def _response_ttl(resp: requests.Response) -> float:
+    """
+    Work out how long a response may be cached.
+    
+    Honors ``Cache-Control: no-store``/``no-cache`` and ``max-age``; other
+    responses fall back to AtlasConstants.CLOUD_CACHE_TTL.
+    
+    Args:
+        resp: Successful HTTP response
+        
+    Returns:
+        Cache lifetime in seconds (0 means do not cache)
+    """
+    for directive in resp.headers.get("Cache-Control", "").lower().split(","):
+        directive = directive.strip()
+        if directive in ("no-store", "no-cache"):
+            return 0
+        if directive.startswith("max-age="):
+            try:
+                return max(int(directive[len("max-age="):]), 0)
+            except ValueError:
+                break
+    return AtlasConstants.CLOUD_CACHE_TTL
+
+
+# Configurations loaded from MIPS_ATLAS_CONFIG or the config file, keyed by
+# the verbose flag and the environment value. Entries expire after
+# AtlasConstants.CONFIG_CACHE_TTL, so an edited config file is picked up
+# within that window; clear() drops them immediately. Only successful loads
+# are kept, so a later call can still pick up a configuration written by
+# ``atlasexplorer configure`` in the same process.
+_config_cache = _TTLCache(maxsize=4)
+
+
+def _load_config(verbose: bool, apikey: Optional[str], channel: Optional[str],
+                 region: Optional[str]) -> AtlasConfig:
+    """
+    Return the AtlasConfig for these arguments, reusing a recent load.
+    
+    Loading reads the environment or config file and resolves the gateway
+    over the network, so instances created without explicit credentials
+    share the result for a while. Explicit apikey/channel/region arguments
+    always load afresh. Each caller gets its own shallow copy, so changing
+    one instance's config does not affect the others.
+    
+    Args:
+        verbose: Enable verbose logging while loading
+        apikey: Direct API key (fallback if no other config found)
+        channel: Direct channel (fallback if no other config found)
+        region: Direct region (fallback if no other config found)
+        
+    Returns:
+        Loaded configuration (hasConfig may be False)
+    """
+    if apikey or channel or region:
+        return AtlasConfig(verbose=verbose, apikey=apikey, channel=channel, region=region)
+    
+    key = (verbose, os.environ.get(AtlasConstants.CONFIG_ENVAR))
+    config = _config_cache.get(key)
+    if config is None:
+        config = AtlasConfig(verbose=verbose)
+        if not config.hasConfig:
+            return config
+        _config_cache.set(key, config, AtlasConstants.CONFIG_CACHE_TTL)
+    return copy.copy(config)
+
+
+# Cloud capabilities keyed by (gateway, apikey); channel lists keyed by apikey.
+_caps_cache = _TTLCache(maxsize=32)
+_channels_cache = _TTLCache(maxsize=16)
+
+
 class AtlasExplorer:
     """
     Main client for interacting with the Atlas Explorer cloud platform.
@@ -53,12 +261,7 @@ class AtlasExplorer:
         self.verbose = verbose
         
         # Load configuration
-        self.config = AtlasConfig(
-            verbose=verbose, 
-            apikey=apikey, 
-            channel=channel, 
-            region=region
-        )
+        self.config = _load_config(verbose, apikey, channel, region)
         
         if not self.config.hasConfig:
             raise ConfigurationError(
@@ -67,7 +270,7 @@ class AtlasExplorer:
         
         # Initialize cloud capabilities cache
         self.versionCaps: Optional[Dict[str, Any]] = None
-        self.channelCaps: Optional[List[Dict[str, Any]]] = None
+        self.channelCaps = None
         
         # Check worker status if gateway is configured
         if hasattr(self.config, "gateway") and self.config.gateway:
@@ -78,10 +281,31 @@ class AtlasExplorer:
             if self.verbose:
                 print("Warning: Gateway is not set. Skipping worker status check.")
     
+    @property
+    def channelCaps(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Cloud capabilities for every version, as returned by the API.
+        
+        The payload is shared with the module-wide capabilities cache and
+        with every other instance using the same gateway and API key, and
+        versionCaps is one of its entries. Treat both as read-only; changing
+        them would alter what later callers see until the cache entry expires.
+        """
+        return self._channelCaps
+    
+    @channelCaps.setter
+    def channelCaps(self, value: Optional[List[Dict[str, Any]]]) -> None:
+        self._channelCaps = value
+        self._version_list: Optional[List[str]] = None
+    
     def _getCloudCaps(self, version: str) -> None:
         """
         Fetch cloud capabilities for specified version.
         
+        The capabilities payload is cached per gateway and API key for the
+        response's ``max-age`` (or AtlasConstants.CLOUD_CACHE_TTL), so repeated
+        lookups skip the network.
+        
         Args:
             version: API version to fetch capabilities for
             
@@ -96,6 +320,35 @@ class AtlasExplorer:
                 "Please reconfigure your settings."
             )
         
+        self.channelCaps = self._fetch_channel_caps()
+        
+        # Find capabilities for specific version
+        if isinstance(self.channelCaps, list):
+            for cap in self.channelCaps:
+                if cap.get("version") == version:
+                    self.versionCaps = cap
+                    return
+            
+            raise NetworkError(f"No capabilities found for version {version}")
+        else:
+            raise NetworkError("Unexpected format for cloud capabilities response")
+    
+    def _fetch_channel_caps(self) -> Any:
+        """
+        Fetch the cloud capabilities payload for every version, using the cache.
+        
+        Returns:
+            Decoded capabilities payload (a list of per-version entries when
+            the API responds as expected)
+            
+        Raises:
+            NetworkError: If capabilities cannot be fetched
+        """
+        cache_key = (self.config.gateway, self.config.apikey)
+        channel_caps = _caps_cache.get(cache_key)
+        if channel_caps is not None:
+            return channel_caps
+        
         url = f"{self.config.gateway}/cloudcaps"
         headers = {
             "Content-Type": "application/json",
@@ -103,7 +356,7 @@ class AtlasExplorer:
         }
         
         try:
-            resp = requests.get(url, headers=headers, timeout=30)
+            resp = _session.get(url, headers=headers, timeout=30)
             resp.raise_for_status()
         except requests.RequestException as e:
             raise NetworkError(f"Error fetching cloud capabilities: {e}")
@@ -111,20 +364,13 @@ class AtlasExplorer:
             raise NetworkError(f"Error fetching cloud capabilities: {e}")
         
         try:
-            self.channelCaps = resp.json()
+            channel_caps = _decode_json(resp)
         except json.JSONDecodeError as e:
             raise NetworkError(f"Invalid JSON response from cloud capabilities API: {e}")
         
-        # Find capabilities for specific version
-        if isinstance(self.channelCaps, list):
-            for cap in self.channelCaps:
-                if cap.get("version") == version:
-                    self.versionCaps = cap
-                    return
-            
-            raise NetworkError(f"No capabilities found for version {version}")
-        else:
-            raise NetworkError("Unexpected format for cloud capabilities response")
+        if isinstance(channel_caps, list):
+            _caps_cache.set(cache_key, channel_caps, _response_ttl(resp))
+        return channel_caps
     
     def getCoreInfo(self, core: str) -> Dict[str, Any]:
         """
@@ -163,6 +409,9 @@ class AtlasExplorer:
         """
         Get list of available API versions.
         
+        The list is computed once per channelCaps value; each call returns
+        a fresh copy, so callers may sort or otherwise change it.
+        
         Returns:
             List of available version strings
             
@@ -174,10 +423,12 @@ class AtlasExplorer:
                 "Cloud capabilities not fetched. Please run _getCloudCaps first."
             )
         
-        if isinstance(self.channelCaps, list):
-            return [cap.get("version", "") for cap in self.channelCaps if cap.get("version")]
-        
-        return []
+        if self._version_list is None:
+            if isinstance(self.channelCaps, list):
+                self._version_list = [cap["version"] for cap in self.channelCaps if cap.get("version")]
+            else:
+                self._version_list = []
+        return list(self._version_list)
     
     def _check_worker_status(self) -> Dict[str, Any]:
         """
@@ -205,10 +456,10 @@ class AtlasExplorer:
         url = f"{self.config.gateway}/dataworkerstatus"
         
         try:
-            resp = requests.get(url, headers=headers, timeout=30)
+            resp = _session.get(url, headers=headers, timeout=30)
             resp.raise_for_status()
             
-            result = resp.json()
+            result = _decode_json(resp)
             if self.verbose:
                 print(f"Worker status response: {result}")
             
@@ -217,7 +468,7 @@ class AtlasExplorer:
         except requests.RequestException as e:
             error_details = ""
             if hasattr(e, 'response') and e.response is not None:
-                error_details = f" (Status: {e.response.status_code}, Text: {e.response.text})"
+                error_details = f" (Status: {e.response.status_code}, Text: {_response_excerpt(e.response)})"
             
             raise NetworkError(f"Error checking worker status: {e}{error_details}")
         except Exception as e:
@@ -255,23 +506,54 @@ class AtlasExplorer:
         }
         
         try:
-            resp = requests.post(url, headers=headers, timeout=30)
+            resp = _session.post(url, headers=headers, timeout=30)
             resp.raise_for_status()
             return resp
             
         except requests.RequestException as e:
             error_msg = f"Error fetching signed URLs: {e}"
             if hasattr(e, 'response') and e.response is not None:
-                error_msg += f" (Status: {e.response.status_code}, Text: {e.response.text})"
+                error_msg += f" (Status: {e.response.status_code}, Text: {_response_excerpt(e.response)})"
             raise NetworkError(error_msg)
         except Exception as e:
             raise NetworkError(f"Error fetching signed URLs: {e}")
+    
+    def getSignedUrlsBatch(self, items: List[Tuple[str, str, str]],
+                           max_workers: int = 8) -> List[requests.Response]:
+        """
+        Get signed URLs for several experiments at once.
+        
+        The requests run concurrently over the shared connection pool, so a
+        batch costs roughly one round-trip instead of one per experiment.
+        
+        Args:
+            items: (exp_uuid, name, core) tuples, one per experiment
+            max_workers: Maximum number of requests in flight
+            
+        Returns:
+            Responses in the same order as ``items``
+            
+        Raises:
+            NetworkError: If any signed URL request fails
+            ConfigurationError: If gateway not configured
+        """
+        if not hasattr(self.config, "gateway") or not self.config.gateway:
+            raise ConfigurationError("Gateway is not configured")
+        
+        if len(items) <= 1:
+            return [self.getSignedUrls(*item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            return list(pool.map(lambda item: self.getSignedUrls(*item), items))
 
 
 def get_channel_list(apikey: str) -> Dict[str, List[Dict[str, Any]]]:
     """
     Fetch the list of available channels for the given API key.
     
+    Results are cached per API key like the cloud capabilities, so the
+    returned dictionary must be treated as read-only.
+    
     Args:
         apikey: API key for authentication
         
@@ -282,6 +564,10 @@ def get_channel_list(apikey: str) -> Dict[str, List[Dict[str, Any]]]:
         NetworkError: If channel list cannot be fetched
         AuthenticationError: If API key is invalid
     """
+    cached = _channels_cache.get(apikey)
+    if cached is not None:
+        return cached
+    
     url = f"{AtlasConstants.AE_GLOBAL_API}/channellist"
     headers = {
         "apikey": apikey,
@@ -289,15 +575,17 @@ def get_channel_list(apikey: str) -> Dict[str, List[Dict[str, Any]]]:
     }
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _session.get(url, headers=headers, timeout=30)
         response.raise_for_status()
-        return response.json()
+        channels = _decode_json(response)
+        _channels_cache.set(apikey, channels, _response_ttl(response))
+        return channels
         
     except requests.RequestException as e:
         if hasattr(e, 'response') and e.response is not None:
             if e.response.status_code == 401:
                 raise AuthenticationError("Invalid API key")
-            error_msg = f"Error fetching channel list: {e.response.status_code} {e.response.text}"
+            error_msg = f"Error fetching channel list: {e.response.status_code} {_response_excerpt(e.response)}"
         else:
             error_msg = f"Network error fetching channel list: {e}"
         
@@ -312,6 +600,10 @@ def validate_user_api_key(apikey: str) -> bool:
     """
     Validate if the provided API key is valid.
     
+    Only the status code matters, so a HEAD request is sent first. Any
+    other answer than 200 is confirmed with a streamed GET whose body is
+    never read, since gateways may reject HEAD with 403, 404, 405 or 501.
+    
     Args:
         apikey: API key to validate
         
@@ -322,7 +614,10 @@ def validate_user_api_key(apikey: str) -> bool:
     headers = {"apikey": apikey}
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _session.head(url, headers=headers, timeout=30, allow_redirects=True)
+        if response.status_code != 200:
+            response = _session.get(url, headers=headers, timeout=30, stream=True)
+            response.close()
         return response.status_code == 200
     except requests.RequestException:
         return False
@@ -22,6 +22,10 @@ class AtlasConstants:
     DEFAULT_TIMEOUT = 300
     HTTP_TIMEOUT = 10
     
+    # Cache Configuration (seconds)
+    CLOUD_CACHE_TTL = 300
+    CONFIG_CACHE_TTL = 60
+    
     # Security Configuration
     SCRYPT_N = 16384
     SCRYPT_R = 8
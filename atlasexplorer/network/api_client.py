@@ -4,8 +4,10 @@ This module provides a robust HTTP client with proper error handling,
 timeouts, and retry logic for communicating with Atlas Explorer APIs.
 """
 
+import io
+import os
 import time
-from typing import Dict, Any, Optional, Union
+from typing import BinaryIO, Dict, Any, Optional, Union
 from pathlib import Path
 
 from ..core.constants import AtlasConstants
@@ -87,12 +89,13 @@ class AtlasAPIClient:
         except Exception as e:
             raise NetworkError(f"Failed to get signed URLs: {e}", url=url)
     
-    def upload_file(self, url: str, file_path: Union[str, Path]) -> bytes:
+    def upload_file(self, url: str, file_path: Union[str, Path, BinaryIO]) -> bytes:
         """Upload a file to the given URL.
         
         Args:
             url: Upload URL (typically a signed URL)
-            file_path: Path to file to upload
+            file_path: Path to file to upload, or an already-open binary
+                file object which is streamed from its current position
             
         Returns:
             Response content
@@ -100,27 +103,56 @@ class AtlasAPIClient:
         Raises:
             NetworkError: If upload fails
         """
+        if hasattr(file_path, "read"):
+            name = Path(getattr(file_path, "name", "<stream>")).name
+            try:
+                size = self._remaining_size(file_path)
+            except Exception as e:
+                raise NetworkError(f"File upload failed: {e}", url=url)
+            return self._post_file(url, file_path, name, size)
+        
         file_path = Path(file_path)
         if not file_path.exists():
             raise NetworkError(f"File to upload does not exist: {file_path}")
         
+        size = file_path.stat().st_size
+        try:
+            with open(file_path, "rb") as f:
+                return self._post_file(url, f, file_path.name, size)
+        except NetworkError:
+            raise
+        except Exception as e:
+            raise NetworkError(f"File upload failed: {e}", url=url)
+    
+    @staticmethod
+    def _remaining_size(fileobj: BinaryIO) -> int:
+        """Return the number of bytes left to read in an open file object."""
+        position = fileobj.tell()
+        try:
+            return os.fstat(fileobj.fileno()).st_size - position
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            end = fileobj.seek(0, os.SEEK_END)
+            fileobj.seek(position)
+            return end - position
+    
+    def _post_file(self, url: str, fileobj: BinaryIO, name: str, size: int) -> bytes:
+        """Stream an open file object to the upload URL."""
         if self.verbose:
-            print(f"Uploading file: {file_path.name} ({file_path.stat().st_size} bytes)")
+            print(f"Uploading file: {name} ({size} bytes)")
         
         headers = {
             "Content-Type": "application/octet-stream",
-            "Content-Length": str(file_path.stat().st_size),
+            "Content-Length": str(size),
         }
         
         try:
             session = self._get_session()
-            with open(file_path, "rb") as f:
-                response = session.post(
-                    url, 
-                    data=f, 
-                    headers=headers,
-                    timeout=300  # Longer timeout for file uploads
-                )
+            response = session.post(
+                url, 
+                data=fileobj, 
+                headers=headers,
+                timeout=300  # Longer timeout for file uploads
+            )
             
             response.raise_for_status()
             return response.content
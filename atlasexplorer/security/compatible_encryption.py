@@ -7,11 +7,11 @@ TypeScript backend format and maintains backward compatibility with legacy forma
 import os
 import struct
 from pathlib import Path
-from typing import Union, Tuple, Optional
+from typing import Iterable, Union, Tuple, Optional
 
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.backends import default_backend
 from Crypto.Cipher import AES
 from Crypto.Random import get_random_bytes
@@ -83,17 +83,9 @@ class CompatibleEncryption:
                 ),
             )
 
-            # Setup AES-GCM cipher
-            cipher = Cipher(
-                algorithms.AES(symmetric_key), 
-                modes.GCM(iv), 
-                backend=default_backend()
-            )
-            encryptor = cipher.encryptor()
-
-            # Encrypt the file data
-            encrypted_data = encryptor.update(file_data) + encryptor.finalize()
-            auth_tag = encryptor.tag
+            # Encrypt the file data with one-shot AES-GCM (tag is appended)
+            sealed = AESGCM(symmetric_key).encrypt(iv, file_data, None)
+            encrypted_data, auth_tag = sealed[:-16], sealed[-16:]
 
             # Build output in new backend format: [iv][key_length][encrypted_key][encrypted_data][auth_tag]
             with open(output_file, "wb") as f:
@@ -169,38 +161,10 @@ class CompatibleEncryption:
             with open(src_file_path, "rb") as f:
                 file_data = f.read()
 
-            # Generate random salt and IV
-            salt = get_random_bytes(16)
-            iv = get_random_bytes(12)  # 12 bytes for GCM
-
-            # Derive key using enhanced scrypt parameters (matching backend)
-            key = scrypt(
-                password.encode(), 
-                salt=salt, 
-                key_len=32, 
-                N=32768,  # Enhanced parameter matching backend
-                r=8, 
-                p=1
-            )
-
-            # Encrypt using AES-256-GCM
-            cipher = Cipher(
-                algorithms.AES(key),
-                modes.GCM(iv),
-                backend=default_backend()
-            )
-            encryptor = cipher.encryptor()
-            
-            encrypted_data = encryptor.update(file_data) + encryptor.finalize()
-            auth_tag = encryptor.tag
-
             # Write in new backend format: [salt][iv][tag][ciphertext]
             encrypted_file_path = str(src_file_path) + ".encrypted"
             with open(encrypted_file_path, "wb") as f:
-                f.write(salt)          # 16 bytes
-                f.write(iv)            # 12 bytes  
-                f.write(auth_tag)      # 16 bytes
-                f.write(encrypted_data)
+                f.write(self._seal_with_password(file_data, password))
 
             # Replace original file
             os.remove(src_file_path)
@@ -212,7 +176,8 @@ class CompatibleEncryption:
         except Exception as error:
             raise EncryptionError(f"New password encryption error: {error}")
 
-    def decrypt_file_with_password(self, src_file_path: Union[str, Path], password: str) -> None:
+    def decrypt_file_with_password(self, src_file_path: Union[str, Path], password: str,
+                                   return_bytes: bool = False) -> Optional[bytes]:
         """Decrypt a password-encrypted file with automatic format detection.
         
         Supports both new and legacy formats with automatic fallback.
@@ -220,6 +185,11 @@ class CompatibleEncryption:
         Args:
             src_file_path: Path to encrypted file
             password: Decryption password
+            return_bytes: Also return the plaintext that was written back to
+                ``src_file_path``, so callers need not re-read the file
+            
+        Returns:
+            The decrypted data if ``return_bytes`` is True, otherwise None
             
         Raises:
             EncryptionError: If decryption fails
@@ -229,17 +199,68 @@ class CompatibleEncryption:
             format_type = self._detect_password_format(src_file_path)
             
             if format_type == self.NEW_PASSWORD_FORMAT:
-                self._decrypt_new_password_format(src_file_path, password)
+                decrypted_data = self._decrypt_new_password_format(src_file_path, password)
             elif format_type == self.LEGACY_PASSWORD_FORMAT:
                 if self.verbose:
                     print("Detected legacy format, using fallback decryption...")
                 self._decrypt_legacy_password_format(src_file_path, password)
+                decrypted_data = None
             else:
                 raise EncryptionError("Unknown password encryption format")
+            
+            if not return_bytes:
+                return None
+            if decrypted_data is None:
+                # The legacy handler only writes the file
+                with open(src_file_path, "rb") as f:
+                    decrypted_data = f.read()
+            return decrypted_data
                 
         except Exception as error:
             raise EncryptionError(f"Password decryption error: {error}")
 
+    def encrypt_bytes(self, plaintext: bytes, password: str) -> bytes:
+        """Encrypt data in memory using the new password-based format.
+        
+        Produces the same layout as ``encrypt_file_with_password`` without
+        touching the filesystem.
+        
+        Args:
+            plaintext: Data to encrypt
+            password: Encryption password
+            
+        Returns:
+            Encrypted payload: [salt(16)][iv(12)][tag(16)][ciphertext]
+            
+        Raises:
+            EncryptionError: If encryption fails
+        """
+        try:
+            return self._seal_with_password(plaintext, password)
+        except Exception as error:
+            raise EncryptionError(f"New password encryption error: {error}")
+
+    def decrypt_bytes(self, ciphertext: bytes, password: str) -> bytes:
+        """Decrypt an in-memory payload in the new password-based format.
+        
+        Legacy payloads are not detected here; use
+        ``decrypt_file_with_password`` for those.
+        
+        Args:
+            ciphertext: Encrypted payload as produced by ``encrypt_bytes``
+            password: Decryption password
+            
+        Returns:
+            The decrypted data
+            
+        Raises:
+            EncryptionError: If decryption fails
+        """
+        try:
+            return self._open_with_password(ciphertext, password)
+        except Exception as error:
+            raise EncryptionError(f"Password decryption error: {error}")
+
     def _detect_hybrid_format(self, file_path: Union[str, Path]) -> str:
         """Detect whether file uses new or legacy hybrid encryption format.
         
@@ -250,13 +271,15 @@ class CompatibleEncryption:
             Format type constant
         """
         try:
+            # Only the fixed-size header matters, so read just that much
+            # rather than the whole (possibly large) payload.
             with open(file_path, "rb") as f:
-                data = f.read()
+                data = f.read(16)
             
             # New format starts with 12-byte IV, then 2-byte key length
             if len(data) >= 14:
                 # Check if bytes 12-14 could be a reasonable key length (RSA keys are typically 256-512 bytes)
-                key_length = struct.unpack('>H', data[12:14])[0]
+                key_length, = struct.unpack_from('>H', data, 12)
                 if 128 <= key_length <= 1024:  # Reasonable RSA key size range
                     return self.NEW_HYBRID_FORMAT
             
@@ -280,14 +303,15 @@ class CompatibleEncryption:
             Format type constant
         """
         try:
-            with open(file_path, "rb") as f:
-                data = f.read()
+            # The decision depends only on the file size, so stat it
+            # instead of reading the payload.
+            size = os.stat(file_path).st_size
             
             # New format: [salt(16)][iv(12)][tag(16)][ciphertext]
             # Legacy format: raw AES-ECB encrypted data with PKCS7 padding
             
             # New format has specific header size
-            if len(data) >= 44:  # 16 + 12 + 16 = 44 bytes header
+            if size >= 44:  # 16 + 12 + 16 = 44 bytes header
                 return self.NEW_PASSWORD_FORMAT
             
             # If file size suggests it could be legacy format
@@ -334,15 +358,8 @@ class CompatibleEncryption:
             ),
         )
 
-        # Decrypt data
-        cipher = Cipher(
-            algorithms.AES(symmetric_key),
-            modes.GCM(iv, auth_tag),
-            backend=default_backend()
-        )
-        decryptor = cipher.decryptor()
-        
-        decrypted_data = decryptor.update(encrypted_data) + decryptor.finalize()
+        # Decrypt data (AESGCM expects the tag appended to the ciphertext)
+        decrypted_data = AESGCM(symmetric_key).decrypt(iv, encrypted_data + auth_tag, None)
 
         # Write decrypted file
         decrypted_file_path = str(input_file) + ".decrypted"
@@ -365,17 +382,54 @@ class CompatibleEncryption:
             "or migrate to new format."
         )
 
-    def _decrypt_new_password_format(self, src_file_path: Union[str, Path], password: str) -> None:
-        """Decrypt file in new password format."""
+    def _decrypt_new_password_format(self, src_file_path: Union[str, Path], password: str) -> bytes:
+        """Decrypt file in new password format and return the plaintext."""
         with open(src_file_path, "rb") as f:
-            # Read salt (16 bytes)
-            salt = f.read(16)
-            # Read IV (12 bytes)
-            iv = f.read(12)
-            # Read auth tag (16 bytes)
-            auth_tag = f.read(16)
-            # Read encrypted data
-            encrypted_data = f.read()
+            decrypted_data = self._open_with_password(f.read(), password)
+
+        # Write decrypted file
+        decrypted_file_path = str(src_file_path) + ".decrypted"
+        with open(decrypted_file_path, "wb") as f:
+            f.write(decrypted_data)
+
+        os.remove(src_file_path)
+        os.rename(decrypted_file_path, src_file_path)
+        
+        return decrypted_data
+
+    @staticmethod
+    def _seal_with_password(plaintext: bytes, password: str) -> bytes:
+        """Encrypt ``plaintext`` into a new password format payload."""
+        # Generate random salt and IV
+        salt = get_random_bytes(16)
+        iv = get_random_bytes(12)  # 12 bytes for GCM
+
+        # Derive key using enhanced scrypt parameters (matching backend)
+        key = scrypt(
+            password.encode(), 
+            salt=salt, 
+            key_len=32, 
+            N=32768,  # Enhanced parameter matching backend
+            r=8, 
+            p=1
+        )
+
+        # Encrypt using one-shot AES-256-GCM (tag is appended)
+        sealed = AESGCM(key).encrypt(iv, plaintext, None)
+
+        # New backend format: [salt(16)][iv(12)][tag(16)][ciphertext]
+        return salt + iv + sealed[-16:] + sealed[:-16]
+
+    @staticmethod
+    def _open_with_password(payload: bytes, password: str) -> bytes:
+        """Decrypt a new password format payload and return the plaintext."""
+        if len(payload) < 44:
+            raise EncryptionError("Data too small for new password format")
+
+        salt = payload[:16]
+        iv = payload[16:28]
+        auth_tag = payload[28:44]
+        encrypted_data = payload[44:]
 
         # Derive key using enhanced scrypt parameters
         key = scrypt(
@@ -387,23 +441,8 @@ class CompatibleEncryption:
             p=1
         )
 
-        # Decrypt using AES-256-GCM
-        cipher = Cipher(
-            algorithms.AES(key),
-            modes.GCM(iv, auth_tag),
-            backend=default_backend()
-        )
-        decryptor = cipher.decryptor()
-        
-        decrypted_data = decryptor.update(encrypted_data) + decryptor.finalize()
-
-        # Write decrypted file
-        decrypted_file_path = str(src_file_path) + ".decrypted"
-        with open(decrypted_file_path, "wb") as f:
-            f.write(decrypted_data)
-
-        os.remove(src_file_path)
-        os.rename(decrypted_file_path, src_file_path)
+        # Decrypt using AES-256-GCM (AESGCM expects the tag appended)
+        return AESGCM(key).decrypt(iv, encrypted_data + auth_tag, None)
 
     def _decrypt_legacy_password_format(self, src_file_path: Union[str, Path], password: str) -> None:
         """Decrypt file in legacy password format - fallback method."""
@@ -421,31 +460,42 @@ class CompatibleEncryption:
         return get_random_bytes(16)
     
     @staticmethod
-    def secure_delete(file_path: Union[str, Path]) -> None:
-        """Securely delete a file by overwriting it with random data.
+    def secure_delete(
+        file_path: Union[str, os.PathLike, Iterable[Union[str, os.PathLike]]]
+    ) -> None:
+        """Securely delete files by overwriting them with random data.
+        
+        Each file is overwritten three times, with an fsync after every pass
+        so the passes cannot be merged in the page cache, and then unlinked.
+        Missing files are skipped.
         
         Args:
-            file_path: Path to file to securely delete
+            file_path: Path to file to securely delete, or an iterable of paths
+                to delete in one call
         """
-        path_obj = Path(file_path)
+        if isinstance(file_path, (str, os.PathLike)):
+            paths = [Path(file_path)]
+        else:
+            paths = [Path(path) for path in file_path]
         
-        if not path_obj.exists():
-            return
-        
-        try:
-            file_size = path_obj.stat().st_size
+        for path_obj in paths:
+            if not path_obj.exists():
+                continue
             
-            with open(path_obj, "r+b") as f:
-                for _ in range(3):
-                    f.seek(0)
-                    f.write(get_random_bytes(file_size))
-                    f.flush()
-                    os.fsync(f.fileno())
-            
-            path_obj.unlink()
-            
-        except (IOError, OSError):
             try:
+                file_size = path_obj.stat().st_size
+                
+                with open(path_obj, "r+b") as f:
+                    for _ in range(3):
+                        f.seek(0)
+                        f.write(get_random_bytes(file_size))
+                        f.flush()
+                        os.fsync(f.fileno())
+                
                 path_obj.unlink()
+                
             except (IOError, OSError):
-                pass
+                try:
+                    path_obj.unlink()
+                except (IOError, OSError):
+                    pass
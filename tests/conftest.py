@@ -0,0 +1,22 @@
+"""Shared pytest configuration for the Atlas Explorer test suite."""
+
+import pytest
+import requests
+
+
+def _blocked_request(self, method, url, *args, **kwargs):
+    # pytest.fail raises a BaseException, so the client's broad
+    # ``except Exception`` handlers cannot turn it into a NetworkError.
+    pytest.fail(f"Real HTTP blocked in tests: {method} {url}")
+
+
+@pytest.fixture(autouse=True)
+def _block_http(request, monkeypatch):
+    """Fail any test that reaches the network through requests.
+
+    Every ``requests.get``/``post`` call ends up in ``Session.request``, so
+    blocking it there covers all modules regardless of how they import
+    requests. Tests marked ``live`` talk to the real service and are exempt.
+    """
+    if request.node.get_closest_marker("live") is None:
+        monkeypatch.setattr(requests.Session, "request", _blocked_request)
@@ -0,0 +1,11 @@
+"""Shared helpers for the Atlas Explorer test suite."""
+
+
+def swap_attr(testcase, obj, name, value):
+    """Set ``obj.name`` to ``value`` until the end of the running test.
+
+    A plain attribute swap undone by ``addCleanup``; cheaper than
+    ``patch.object`` for the stand-ins the hot unit tests install.
+    """
+    testcase.addCleanup(setattr, obj, name, getattr(obj, name))
+    setattr(obj, name, value)
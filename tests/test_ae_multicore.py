@@ -20,11 +20,13 @@ This test will:
 from atlasexplorer import AtlasExplorer, Experiment
 from dotenv import load_dotenv
 import locale
+import pytest
 import os
 
 load_dotenv()
 
 
+@pytest.mark.live
 def test_multicore():
     locale.setlocale(locale.LC_ALL, "")
     # Get credentials from environment variable
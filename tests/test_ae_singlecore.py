@@ -19,11 +19,13 @@ This test will:
 """
 from atlasexplorer import AtlasExplorer, Experiment
 import locale
+import pytest
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+@pytest.mark.live
 def test_singlecore():
     locale.setlocale(locale.LC_ALL, "")
     # Get credentials from environment variable
@@ -4,9 +4,11 @@ This test suite covers the current API client implementation that handles
 HTTP communication with the Atlas Explorer cloud service.
 """
 
+import io
 import unittest
 import tempfile
 import os
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import json
@@ -131,29 +133,70 @@ class TestAtlasAPIClientSignedURLs(unittest.TestCase):
 class TestAtlasAPIClientFileUpload(unittest.TestCase):
     """Test file upload functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the upload payload once for the whole class."""
+        cls._stack = ExitStack()
+        cls.addClassCleanup(cls._stack.close)
+        temp_dir = cls._stack.enter_context(tempfile.TemporaryDirectory())
+        cls._tmp_path = Path(temp_dir) / "upload.bin"
+        cls._tmp_path.write_bytes(b"test file content")
+        cls._fp = cls._stack.enter_context(open(cls._tmp_path, "rb"))
+
     def setUp(self):
         """Set up test fixtures."""
         self.client = AtlasAPIClient("https://api.example.com", verbose=False)
+        self._fp.seek(0)
 
     @patch('requests.Session.post')
-    def test_upload_file_success(self, mock_post):
-        """Test successful file upload."""
+    def test_upload_file_success_matrix(self, mock_post):
+        """Test successful file upload with and without verbose output."""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = b"upload_success"
         mock_response.raise_for_status = Mock()  # Mock this to avoid issues
+        # Drain the stream like a real session would
+        mock_post.side_effect = lambda *args, data, **kwargs: (data.read(), mock_response)[1]
+
+        for verbose in (True, False):
+            with self.subTest(verbose=verbose):
+                self._fp.seek(0)
+                client = AtlasAPIClient("https://api.example.com", verbose=verbose)
+                with patch('builtins.print') as mock_print:
+                    result = client.upload_file("https://upload.example.com", self._fp)
+
+                self.assertEqual(result, b"upload_success")
+                # Only the verbose client should print the upload message
+                self.assertEqual(mock_print.called, verbose)
+                # The open handle is streamed as-is rather than re-opened
+                self.assertIs(mock_post.call_args.kwargs["data"], self._fp)
+                self.assertEqual(mock_post.call_args.kwargs["headers"]["Content-Length"], "17")
+
+    @patch('requests.Session.post')
+    def test_upload_file_from_path(self, mock_post):
+        """Test that a path argument is opened and streamed."""
+        mock_response = Mock()
+        mock_response.content = b"upload_success"
         mock_post.return_value = mock_response
 
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_file.write(b"test file content")
-            temp_file_path = temp_file.name
+        result = self.client.upload_file("https://upload.example.com", str(self._tmp_path))
 
-        try:
-            result = self.client.upload_file("https://upload.example.com", temp_file_path)
-            self.assertEqual(result, b"upload_success")
-        finally:
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+        self.assertEqual(result, b"upload_success")
+        self.assertEqual(mock_post.call_args.kwargs["headers"]["Content-Length"], "17")
+
+    @patch('requests.Session.post')
+    def test_upload_file_from_in_memory_stream(self, mock_post):
+        """Test uploading a file object without a file descriptor."""
+        mock_response = Mock()
+        mock_response.content = b"upload_success"
+        mock_post.return_value = mock_response
+
+        stream = io.BytesIO(b"in-memory payload")
+        stream.seek(3)
+        self.client.upload_file("https://upload.example.com", stream)
+
+        self.assertEqual(mock_post.call_args.kwargs["headers"]["Content-Length"], "14")
+        self.assertEqual(stream.tell(), 3)
 
     def test_upload_file_nonexistent_file(self):
         """Test upload of non-existent file."""
@@ -170,42 +213,10 @@ class TestAtlasAPIClientFileUpload(unittest.TestCase):
         mock_response.raise_for_status.side_effect = requests.HTTPError("Server Error")
         mock_post.return_value = mock_response
 
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_file.write(b"test content")
-            temp_file_path = temp_file.name
-
-        try:
-            with self.assertRaises(NetworkError) as context:
-                self.client.upload_file("https://upload.example.com", temp_file_path)
-            
-            self.assertIn("File upload failed", str(context.exception))
-        finally:
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
-
-    @patch('requests.Session.post')
-    def test_upload_file_verbose_output(self, mock_post):
-        """Test verbose output during upload."""
-        client_verbose = AtlasAPIClient("https://api.example.com", verbose=True)
+        with self.assertRaises(NetworkError) as context:
+            self.client.upload_file("https://upload.example.com", self._tmp_path)
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"success"
-        mock_response.raise_for_status = Mock()  # Mock this to avoid issues
-        mock_post.return_value = mock_response
-
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_file.write(b"test content")
-            temp_file_path = temp_file.name
-
-        try:
-            with patch('builtins.print') as mock_print:
-                client_verbose.upload_file("https://upload.example.com", temp_file_path)
-                # Should have printed upload message
-                mock_print.assert_called()
-        finally:
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+        self.assertIn("File upload failed", str(context.exception))
 
 
 class TestAtlasAPIClientStatusOperations(unittest.TestCase):
@@ -6,753 +6,597 @@ Tests the new AtlasExplorer class extracted in Phase 1.2 to ensure
 it maintains functionality while providing better architecture.
 """
 
+import contextlib
+import dataclasses
+import os
 import unittest
-import json
 import requests
-from unittest.mock import Mock, patch, MagicMock
+from json import JSONDecodeError
+from typing import Optional
+from unittest.mock import NonCallableMock, patch
 
+from atlasexplorer.core import client as _client
 from atlasexplorer.core.client import AtlasExplorer, get_channel_list, validate_user_api_key
-from atlasexplorer.core.config import AtlasConfig
-from atlasexplorer.utils.exceptions import NetworkError
+from atlasexplorer.core.constants import AtlasConstants
 from atlasexplorer.utils.exceptions import (
     NetworkError,
     ConfigurationError,
     AuthenticationError
 )
+from helpers import swap_attr
 
 
-class TestAtlasExplorer(unittest.TestCase):
-    """Test cases for the AtlasExplorer class."""
+@dataclasses.dataclass(slots=True, frozen=True)
+class _StubConfig:
+    """Immutable attribute holder standing in for AtlasConfig."""
+    
+    hasConfig: bool
+    apikey: str
+    channel: str
+    region: str
+    gateway: Optional[str]
+
+
+class _Resp:
+    """Minimal stand-in for requests.Response.
+    
+    Pass an exception as ``json_data`` to make ``json()`` raise it, and a
+    status of 400 or above to make ``raise_for_status()`` raise HTTPError.
+    The HTTPError is built once per response and re-raised on every call.
+    """
+    
+    __slots__ = ('_json', 'status_code', 'text', 'headers', '_http_error')
+    
+    def __init__(self, json_data=None, status_code=200, text="", headers=None):
+        self._json = json_data
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self._http_error = None
+        if status_code >= 400:
+            self._http_error = requests.HTTPError(f"{status_code} Error: {text}", response=self)
+    
+    def json(self):
+        if isinstance(self._json, Exception):
+            raise self._json
+        return self._json
+    
+    def raise_for_status(self):
+        if self._http_error is not None:
+            raise self._http_error
+    
+    def close(self):
+        pass
+
+
+_BARE_NEW = AtlasExplorer.__new__
+
+
+def _bare_explorer(config, **attrs):
+    """Return an AtlasExplorer on ``config`` without running ``__init__``.
+    
+    Keyword arguments override the default attribute values.
+    """
+    explorer = _BARE_NEW(AtlasExplorer)
+    explorer.config = config
+    explorer.verbose = False
+    explorer.versionCaps = None
+    explorer.channelCaps = None
+    for name, value in attrs.items():
+        setattr(explorer, name, value)
+    return explorer
+
+
+_TEMPLATE_CONFIG = _StubConfig(
+    hasConfig=True,
+    apikey="test-api-key",
+    channel="test-channel",
+    region="test-region",
+    gateway="https://test-gateway.example.com",
+)
+
+
+# Response payloads shared by reference; the client only reads them.
+_VERSION_CAPS_TWO_ARCHES = {
+    "shinro": {
+        "arches": [
+            {"name": "I8500", "num_threads": 1},
+            {"name": "P8500", "num_threads": 2}
+        ]
+    }
+}
+_VERSION_CAPS_ONE_ARCH = {
+    "shinro": {
+        "arches": [{"name": "I8500", "num_threads": 1}]
+    }
+}
+_VERSION_CAPS_NO_SHINRO = {"version": "0.0.97", "other": "data"}
+_VERSION_CAPS_BAD_ARCHES = {"version": "0.0.97", "shinro": {"arches": "not_a_list"}}
+_VERSION_CAPS_OTHER_ARCHES = {
+    "version": "0.0.97",
+    "shinro": {
+        "arches": [
+            {"name": "I7500", "features": ["feature1"]},
+            {"name": "M7500", "features": ["feature2"]},
+        ]
+    }
+}
+_CHANNEL_CAPS_THREE_VERSIONS = [
+    {"version": "0.0.97"},
+    {"version": "0.0.98"},
+    {"version": "1.0.0"}
+]
+_CHANNEL_CAPS_V97 = [
+    {"version": "0.0.97", "shinro": {"arches": [{"name": "I8500"}]}}
+]
+_CHANNEL_CAPS_AROUND_V97 = [
+    {"version": "0.0.95", "features": ["feature1"]},
+    {"version": "0.0.97", "features": ["feature2", "feature3"]},
+    {"version": "0.0.98", "features": ["feature4"]},
+]
+_CHANNEL_CAPS_BEFORE_V97 = [
+    {"version": "0.0.95", "features": ["feature1"]},
+    {"version": "0.0.96", "features": ["feature2"]},
+]
+_CHANNEL_CAPS_WITH_UNVERSIONED = [
+    {"version": "1.0.0", "other": "data"},
+    {"version": "2.0.0", "other": "data"},
+    {"no_version": "data"}  # Filtered out by getVersionList
+]
+_CHANNEL_LIST_PAYLOAD = {
+    "channels": [
+        {"name": "production", "regions": ["us-east", "eu-west"]},
+        {"name": "staging", "regions": ["us-west"]}
+    ]
+}
+_SIGNED_URLS_PAYLOAD = {
+    "exppackageurl": "https://upload.example.com/exp123",
+    "statusget": "https://status.example.com/exp123"
+}
+
+# Canned responses and errors shared by reference; _Resp never changes its
+# own state.
+_JSON_DECODE_ERR = JSONDecodeError("Invalid JSON", "", 0)
+_CONN_ERROR = requests.ConnectionError("Network error")
+_RESP_WORKERS_UP = _Resp({"status": True, "workers": 5})
+_RESP_OK = _Resp(status_code=200)
+_RESP_CAPS_V97 = _Resp(_CHANNEL_CAPS_V97)
+_RESP_CAPS_AROUND_V97 = _Resp(_CHANNEL_CAPS_AROUND_V97)
+_RESP_CHANNEL_LIST = _Resp(_CHANNEL_LIST_PAYLOAD)
+_RESP_SIGNED_URLS = _Resp(_SIGNED_URLS_PAYLOAD)
+_RESP_BAD_JSON = _Resp(_JSON_DECODE_ERR)
+_RESP_401 = _Resp(status_code=401, text="Unauthorized")
+_RESP_500 = _Resp(status_code=500, text="Internal Server Error")
+
+
+# The client's shared session is swapped for one spec'd stand-in for the
+# whole module, so no test can reach the network.
+_SESSION = NonCallableMock(spec=requests.Session)
+_HTTP_PATCHER = patch.object(_client, '_session', _SESSION)
+
+
+def setUpModule():
+    """Start the module-wide HTTP patch."""
+    _HTTP_PATCHER.start()
+
+
+def tearDownModule():
+    """Stop the module-wide HTTP patch."""
+    _HTTP_PATCHER.stop()
+
+
+class _MockedHTTPTestCase(unittest.TestCase):
+    """Base class exposing the module-wide session get/head/post mocks.
+    
+    The mocks and the client's config and response caches are reset before
+    every test, so each test only sets the return values or side effects it
+    needs.
+    """
     
     def setUp(self):
-        """Set up test fixtures."""
-        self.mock_config = Mock(spec=AtlasConfig)
-        self.mock_config.hasConfig = True
-        self.mock_config.apikey = "test-api-key"
-        self.mock_config.channel = "test-channel"
-        self.mock_config.region = "test-region"
-        self.mock_config.gateway = "https://test-gateway.example.com"
-    
-    @patch('atlasexplorer.core.client.AtlasConfig')
-    def test_atlas_explorer_initialization_success(self, mock_atlas_config):
+        """Reset the shared HTTP mocks and response caches."""
+        _client._config_cache.clear()
+        _client._caps_cache.clear()
+        _client._channels_cache.clear()
+        self.mock_get = _SESSION.get
+        self.mock_head = _SESSION.head
+        self.mock_post = _SESSION.post
+        self.mock_get.reset_mock(return_value=True, side_effect=True)
+        self.mock_head.reset_mock(return_value=True, side_effect=True)
+        self.mock_post.reset_mock(return_value=True, side_effect=True)
+
+
+class _SharedExplorerTestCase(_MockedHTTPTestCase):
+    """Base class with class-level constructor patches and a bare explorer.
+    
+    Each test gets its own explorer built without running ``__init__``;
+    constructor tests call ``AtlasExplorer()`` under the class patches.
+    """
+    
+    mock_config = _TEMPLATE_CONFIG
+    
+    @classmethod
+    def setUpClass(cls):
+        """Patch AtlasConfig and the worker check for the whole class."""
+        super().setUpClass()
+        stack = contextlib.ExitStack()
+        cls.addClassCleanup(stack.close)
+        cls.mock_atlas_config = stack.enter_context(
+            patch.object(_client, 'AtlasConfig',
+                         return_value=_TEMPLATE_CONFIG)
+        )
+        cls.mock_check = stack.enter_context(
+            patch.object(AtlasExplorer, '_check_worker_status', return_value={"status": True})
+        )
+    
+    def setUp(self):
+        """Reset the class-level patches and build a bare explorer."""
+        super().setUp()
+        self.mock_atlas_config.reset_mock()
+        self.mock_atlas_config.return_value = self.mock_config
+        self.mock_check.reset_mock()
+        self.mock_check.return_value = {"status": True}
+        self.explorer = _bare_explorer(self.mock_config)
+
+
+class TestAtlasExplorer(_SharedExplorerTestCase):
+    """Test cases for the AtlasExplorer class."""
+    
+    def test_atlas_explorer_initialization_success(self):
         """Test successful AtlasExplorer initialization."""
-        mock_atlas_config.return_value = self.mock_config
-        
-        with patch.object(AtlasExplorer, '_check_worker_status') as mock_check:
-            mock_check.return_value = {"status": True}
-            
-            explorer = AtlasExplorer(
-                apikey="test-key", 
-                channel="test-channel", 
-                region="test-region",
-                verbose=False
-            )
-            
-            self.assertEqual(explorer.config, self.mock_config)
-            self.assertFalse(explorer.verbose)
-            mock_atlas_config.assert_called_once_with(
-                verbose=False,
-                apikey="test-key",
-                channel="test-channel", 
-                region="test-region"
-            )
-    
-    @patch('atlasexplorer.core.client.AtlasConfig')
-    def test_atlas_explorer_no_config(self, mock_atlas_config):
+        explorer = AtlasExplorer(
+            apikey="test-key", 
+            channel="test-channel", 
+            region="test-region",
+            verbose=False
+        )
+        
+        self.assertEqual(explorer.config, self.mock_config)
+        self.assertFalse(explorer.verbose)
+        self.assertEqual(self.mock_atlas_config.call_count, 1)
+        self.assertEqual(self.mock_atlas_config.call_args.kwargs, {
+            "verbose": False,
+            "apikey": "test-key",
+            "channel": "test-channel",
+            "region": "test-region",
+        })
+        self.assertEqual(self.mock_check.call_count, 1)
+    
+    def test_atlas_explorer_no_config(self):
         """Test AtlasExplorer initialization with no configuration."""
-        mock_config = Mock(spec=AtlasConfig)
-        mock_config.hasConfig = False
-        mock_atlas_config.return_value = mock_config
+        self.mock_atlas_config.return_value = dataclasses.replace(
+            self.mock_config, hasConfig=False
+        )
         
         with self.assertRaises(ConfigurationError) as context:
             AtlasExplorer()
         
-        self.assertIn("Cloud connection is not setup", str(context.exception))
+        self.assertEqual(context.exception.message, "Cloud connection is not setup. Please run atlas explorer configuration.")
     
-    @patch('atlasexplorer.core.client.AtlasConfig')
-    def test_atlas_explorer_worker_down(self, mock_atlas_config):
-        """Test AtlasExplorer initialization with worker down."""
-        mock_atlas_config.return_value = self.mock_config
+    def test_atlas_explorer_reuses_loaded_config(self):
+        """Test instances without explicit credentials share one config load."""
+        first = AtlasExplorer()
+        second = AtlasExplorer()
         
-        with patch.object(AtlasExplorer, '_check_worker_status') as mock_check:
-            mock_check.return_value = {"status": False}
-            
-            with self.assertRaises(NetworkError) as context:
-                AtlasExplorer()
-            
-            self.assertIn("service is down", str(context.exception))
+        self.assertEqual(first.config, second.config)
+        self.assertIsNot(first.config, second.config)
+        self.assertEqual(self.mock_atlas_config.call_count, 1)
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_get_cloud_caps_success(self, mock_get):
-        """Test successful cloud capabilities fetching."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = [
-            {"version": "0.0.97", "shinro": {"arches": [{"name": "I8500"}]}}
-        ]
-        mock_get.return_value = mock_response
+    def test_atlas_explorer_explicit_credentials_bypass_config_cache(self):
+        """Test explicit apikey/channel/region always load a fresh config."""
+        AtlasExplorer()
+        AtlasExplorer(apikey="test-key", channel="test-channel", region="test-region")
+        AtlasExplorer(apikey="test-key", channel="test-channel", region="test-region")
         
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                explorer._getCloudCaps("0.0.97")
-                
-                self.assertEqual(explorer.versionCaps["version"], "0.0.97")
-                self.assertIsInstance(explorer.channelCaps, list)
+        self.assertEqual(self.mock_atlas_config.call_count, 3)
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_get_cloud_caps_network_error(self, mock_get):
-        """Test cloud capabilities fetching with network error."""
-        mock_get.side_effect = Exception("Network error")
+    def test_atlas_explorer_config_cache_follows_environment(self):
+        """Test a changed MIPS_ATLAS_CONFIG value is loaded instead of the cached one."""
+        with patch.dict(os.environ, {AtlasConstants.CONFIG_ENVAR: "key:chan:region"}):
+            AtlasExplorer()
+        with patch.dict(os.environ, {AtlasConstants.CONFIG_ENVAR: "key:other:region"}):
+            AtlasExplorer()
         
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                
-                with self.assertRaises(NetworkError):
-                    explorer._getCloudCaps("0.0.97")
+        self.assertEqual(self.mock_atlas_config.call_count, 2)
     
-    def test_get_cloud_caps_no_gateway(self):
-        """Test cloud capabilities fetching with no gateway configured."""
-        config = Mock(spec=AtlasConfig)
-        config.hasConfig = True
-        config.gateway = None
+    def test_atlas_explorer_config_cache_expires(self):
+        """Test a cached config is reloaded once CONFIG_CACHE_TTL has passed."""
+        with patch.object(_client.time, "monotonic", return_value=1000.0):
+            AtlasExplorer()
+        with patch.object(_client.time, "monotonic",
+                          return_value=1000.0 + AtlasConstants.CONFIG_CACHE_TTL):
+            AtlasExplorer()
         
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                
-                with self.assertRaises(ConfigurationError) as context:
-                    explorer._getCloudCaps("0.0.97")
-                
-                self.assertIn("Gateway is not configured", str(context.exception))
+        self.assertEqual(self.mock_atlas_config.call_count, 2)
+    
+    def test_atlas_explorer_missing_config_not_cached(self):
+        """Test a failed configuration load is retried on the next instance."""
+        self.mock_atlas_config.return_value = dataclasses.replace(
+            self.mock_config, hasConfig=False
+        )
+        with self.assertRaises(ConfigurationError):
+            AtlasExplorer()
+        
+        self.mock_atlas_config.return_value = self.mock_config
+        explorer = AtlasExplorer()
+        
+        self.assertEqual(explorer.config, self.mock_config)
+        self.assertEqual(self.mock_atlas_config.call_count, 2)
+    
+    def test_atlas_explorer_worker_down(self):
+        """Test AtlasExplorer initialization with worker down."""
+        self.mock_check.return_value = {"status": False}
+        
+        with self.assertRaises(NetworkError) as context:
+            AtlasExplorer()
+        
+        self.assertEqual(context.exception.message, "Atlas Explorer service is down, please try later")
+    
+    def test_get_cloud_caps_success(self):
+        """Test successful cloud capabilities fetching."""
+        self.mock_get.return_value = _RESP_CAPS_V97
+        
+        self.explorer._getCloudCaps("0.0.97")
+        
+        self.assertEqual(self.explorer.versionCaps, _CHANNEL_CAPS_V97[0])
     
     def test_get_core_info_success(self):
         """Test successful core information retrieval."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                explorer.versionCaps = {
-                    "shinro": {
-                        "arches": [
-                            {"name": "I8500", "num_threads": 1},
-                            {"name": "P8500", "num_threads": 2}
-                        ]
-                    }
-                }
-                
-                core_info = explorer.getCoreInfo("I8500")
-                
-                self.assertEqual(core_info["name"], "I8500")
-                self.assertEqual(core_info["num_threads"], 1)
+        self.explorer.versionCaps = _VERSION_CAPS_TWO_ARCHES
+        
+        core_info = self.explorer.getCoreInfo("I8500")
+        
+        self.assertEqual(core_info["name"], "I8500")
+        self.assertEqual(core_info["num_threads"], 1)
     
     def test_get_core_info_not_found(self):
         """Test core information retrieval for unsupported core."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                explorer.versionCaps = {
-                    "shinro": {
-                        "arches": [{"name": "I8500", "num_threads": 1}]
-                    }
-                }
-                
-                with self.assertRaises(NetworkError) as context:
-                    explorer.getCoreInfo("UNKNOWN_CORE")
-                
-                self.assertIn("not supported", str(context.exception))
+        self.explorer.versionCaps = _VERSION_CAPS_ONE_ARCH
+        
+        with self.assertRaises(NetworkError) as context:
+            self.explorer.getCoreInfo("UNKNOWN_CORE")
+        
+        self.assertEqual(context.exception.message, "Core UNKNOWN_CORE is not supported by the cloud capabilities")
     
     def test_get_core_info_no_caps(self):
         """Test core information retrieval without cloud capabilities."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                explorer.versionCaps = None
-                
-                with self.assertRaises(ConfigurationError):
-                    explorer.getCoreInfo("I8500")
+        self.explorer.versionCaps = None
+        
+        with self.assertRaises(ConfigurationError):
+            self.explorer.getCoreInfo("I8500")
     
     def test_get_version_list(self):
         """Test version list retrieval."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                explorer.channelCaps = [
-                    {"version": "0.0.97"},
-                    {"version": "0.0.98"},
-                    {"version": "1.0.0"}
-                ]
-                
-                versions = explorer.getVersionList()
-                
-                self.assertEqual(versions, ["0.0.97", "0.0.98", "1.0.0"])
-    
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_check_worker_status_success(self, mock_get):
-        """Test successful worker status check."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"status": True, "workers": 5}
-        mock_get.return_value = mock_response
+        self.explorer.channelCaps = _CHANNEL_CAPS_THREE_VERSIONS
         
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            explorer = AtlasExplorer(verbose=False)
-            status = explorer._check_worker_status()
-            
-            self.assertTrue(status["status"])
-            self.assertEqual(status["workers"], 5)
+        versions = self.explorer.getVersionList()
+        
+        self.assertEqual(versions, ["0.0.97", "0.0.98", "1.0.0"])
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_check_worker_status_error(self, mock_get):
-        """Test worker status check with error."""
-        mock_get.side_effect = Exception("Connection failed")
+    def test_get_version_list_cached_until_caps_change(self):
+        """Test the version list is reused until channelCaps is reassigned."""
+        self.explorer.channelCaps = _CHANNEL_CAPS_THREE_VERSIONS
+        versions = self.explorer.getVersionList()
+        versions.reverse()
         
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            # The constructor will call _check_worker_status() and raise NetworkError
-            with self.assertRaises(NetworkError):
-                AtlasExplorer(verbose=False)
+        # Callers get copies, so changing one leaves the cached list intact
+        self.assertEqual(self.explorer.getVersionList(), ["0.0.97", "0.0.98", "1.0.0"])
+        self.assertIsNot(self.explorer.getVersionList(), self.explorer.getVersionList())
+        
+        self.explorer.channelCaps = _CHANNEL_CAPS_WITH_UNVERSIONED
+        self.assertEqual(self.explorer.getVersionList(), ["1.0.0", "2.0.0"])
     
-    @patch('atlasexplorer.core.client.requests.post')
-    def test_get_signed_urls_success(self, mock_post):
+    def test_get_signed_urls_success(self):
         """Test successful signed URLs retrieval."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "exppackageurl": "https://upload.example.com/exp123",
-            "statusget": "https://status.example.com/exp123"
-        }
-        mock_post.return_value = mock_response
-        
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                
-                response = explorer.getSignedUrls("test-uuid", "test-exp", "I8500")
-                
-                self.assertEqual(response, mock_response)
-                mock_post.assert_called_once()
-
-
-class TestHelperFunctions(unittest.TestCase):
-    """Test cases for helper functions."""
-    
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_get_channel_list_success(self, mock_get):
-        """Test successful channel list retrieval."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
-            "channels": [
-                {"name": "production", "regions": ["us-east", "eu-west"]},
-                {"name": "staging", "regions": ["us-west"]}
-            ]
-        }
-        mock_get.return_value = mock_response
+        self.mock_post.return_value = _RESP_SIGNED_URLS
         
-        result = get_channel_list("test-api-key")
+        response = self.explorer.getSignedUrls("test-uuid", "test-exp", "I8500")
         
-        self.assertEqual(len(result["channels"]), 2)
-        self.assertEqual(result["channels"][0]["name"], "production")
+        self.assertIs(response, _RESP_SIGNED_URLS)
+        self.mock_post.assert_called_once()
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_get_channel_list_auth_error(self, mock_get):
-        """Test channel list retrieval with authentication error."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.text = "Unauthorized"
-        mock_get.return_value = mock_response
+    def test_get_signed_urls_batch(self):
+        """Test batch signed URL retrieval keeps the order of the requests."""
+        self.mock_post.side_effect = lambda url, headers, timeout: _Resp({"uuid": headers["exp-uuid"]})
+        items = [(f"uuid-{i}", f"exp-{i}", "I8500") for i in range(5)]
         
-        # Create a proper HTTPError with the response
-        http_error = requests.HTTPError("401 Client Error: Unauthorized")
-        http_error.response = mock_response
-        mock_response.raise_for_status.side_effect = http_error
+        responses = self.explorer.getSignedUrlsBatch(items)
         
-        with self.assertRaises(AuthenticationError):
-            get_channel_list("invalid-api-key")
+        self.assertEqual([r.json()["uuid"] for r in responses], [f"uuid-{i}" for i in range(5)])
+        self.assertEqual(self.mock_post.call_count, 5)
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_get_channel_list_network_error(self, mock_get):
-        """Test channel list retrieval with network error."""
-        mock_get.side_effect = Exception("Network error")
+    def test_get_signed_urls_batch_failure(self):
+        """Test a failed request in the batch raises NetworkError."""
+        self.mock_post.side_effect = lambda url, headers, timeout: (
+            _RESP_500 if headers["exp-uuid"] == "uuid-2" else _RESP_SIGNED_URLS
+        )
+        items = [(f"uuid-{i}", f"exp-{i}", "I8500") for i in range(4)]
         
-        with self.assertRaises(NetworkError):
-            get_channel_list("test-api-key")
+        with self.assertRaises(NetworkError) as cm:
+            self.explorer.getSignedUrlsBatch(items)
+        
+        self.assertIn("Status: 500", str(cm.exception))
+    
+    # (label, gateway, response or exception from session.get,
+    #  expected exception type, expected message)
+    _CLOUD_CAPS_FAILURES = (
+        ("invalid JSON", _TEMPLATE_CONFIG.gateway, _RESP_BAD_JSON, NetworkError,
+         f"Invalid JSON response from cloud capabilities API: {_JSON_DECODE_ERR}"),
+        ("version missing", _TEMPLATE_CONFIG.gateway, _Resp(_CHANNEL_CAPS_BEFORE_V97), NetworkError,
+         "No capabilities found for version 0.0.99"),
+        ("bad format", _TEMPLATE_CONFIG.gateway, _Resp("unexpected string response"), NetworkError,
+         "Unexpected format for cloud capabilities response"),
+        ("connection error", _TEMPLATE_CONFIG.gateway, _CONN_ERROR, NetworkError,
+         f"Error fetching cloud capabilities: {_CONN_ERROR}"),
+        # Errors outside requests are wrapped too (line 109)
+        ("unexpected error", _TEMPLATE_CONFIG.gateway, ValueError("Generic error"), NetworkError,
+         "Error fetching cloud capabilities: Generic error"),
+        ("no gateway", None, None, ConfigurationError,
+         "Gateway is not configured. Cannot fetch cloud capabilities. "
+         "This usually means there's an issue with the API service or your configuration. "
+         "Please reconfigure your settings."),
+    )
+    
+    def test_getCloudCaps_failures(self):
+        """Test every way _getCloudCaps can fail."""
+        for label, gateway, outcome, exc_type, expected in self._CLOUD_CAPS_FAILURES:
+            with self.subTest(label):
+                _client._caps_cache.clear()
+                explorer = _bare_explorer(dataclasses.replace(self.mock_config, gateway=gateway))
+                if isinstance(outcome, Exception):
+                    self.mock_get.side_effect = outcome
+                else:
+                    self.mock_get.side_effect = None
+                    self.mock_get.return_value = outcome
+                
+                with self.assertRaises(exc_type) as cm:
+                    explorer._getCloudCaps("0.0.99")
+                
+                self.assertEqual(cm.exception.message, expected)
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_validate_user_api_key_valid(self, mock_get):
-        """Test API key validation with valid key."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
-        
-        result = validate_user_api_key("valid-api-key")
+    def test_constructor_no_gateway_verbose(self):
+        """Test constructor with no gateway set and verbose mode."""
+        self.mock_atlas_config.return_value = dataclasses.replace(
+            self.mock_config, gateway=None
+        )
         
-        self.assertTrue(result)
+        with patch('builtins.print') as mock_print:
+            AtlasExplorer(verbose=True)
+            
+            # Should print warning about gateway not set
+            mock_print.assert_called_with("Warning: Gateway is not set. Skipping worker status check.")
+        self.mock_check.assert_not_called()
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_validate_user_api_key_invalid(self, mock_get):
-        """Test API key validation with invalid key."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_get.return_value = mock_response
+    def test_getCloudCaps_successful_version_match(self):
+        """Test _getCloudCaps with successful version match."""
+        self.mock_get.return_value = _RESP_CAPS_AROUND_V97
         
-        result = validate_user_api_key("invalid-api-key")
+        self.explorer._getCloudCaps("0.0.97")
         
-        self.assertFalse(result)
+        # Should set versionCaps to the matching version
+        self.assertEqual(self.explorer.versionCaps, {"version": "0.0.97", "features": ["feature2", "feature3"]})
+        self.assertEqual(self.explorer.channelCaps, _CHANNEL_CAPS_AROUND_V97)
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_validate_user_api_key_network_error(self, mock_get):
-        """Test API key validation with network error."""
-        mock_get.side_effect = Exception("Network error")
+    def test_getCloudCaps_reuses_cached_caps(self):
+        """Test a second _getCloudCaps call is served from the cache."""
+        self.mock_get.return_value = _RESP_CAPS_AROUND_V97
         
-        result = validate_user_api_key("test-api-key")
-        
-        self.assertFalse(result)
-
-
-class TestAtlasExplorerAdditionalCoverage(unittest.TestCase):
-    """Additional tests to improve coverage of AtlasExplorer client."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_config = Mock()
-        self.mock_config.apikey = "test-api-key"
-        self.mock_config.channel = "test-channel"
-        self.mock_config.region = "test-region"
-        self.mock_config.gateway = "https://test-gateway.example.com"
-    
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_getCloudCaps_json_decode_error(self, mock_get):
-        """Test _getCloudCaps with JSON decode error."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-        mock_get.return_value = mock_response
-        
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                
-                with self.assertRaises(NetworkError) as cm:
-                    explorer._getCloudCaps("0.0.97")
-                
-                self.assertIn("Invalid JSON response", str(cm.exception))
-    
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_getCloudCaps_version_not_found(self, mock_get):
-        """Test _getCloudCaps when requested version is not found."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = [
-            {"version": "0.0.95", "features": ["feature1"]},
-            {"version": "0.0.96", "features": ["feature2"]},
-        ]
-        mock_get.return_value = mock_response
+        self.explorer._getCloudCaps("0.0.97")
+        _bare_explorer(self.mock_config)._getCloudCaps("0.0.98")
+        self.explorer._getCloudCaps("0.0.95")
         
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                
-                with self.assertRaises(NetworkError) as cm:
-                    explorer._getCloudCaps("0.0.99")  # Version not in list
-                
-                self.assertIn("No capabilities found for version 0.0.99", str(cm.exception))
-    
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_getCloudCaps_unexpected_format(self, mock_get):
-        """Test _getCloudCaps with unexpected response format."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = "unexpected string response"
-        mock_get.return_value = mock_response
-        
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                
-                with self.assertRaises(NetworkError) as cm:
-                    explorer._getCloudCaps("0.0.97")
-                
-                self.assertIn("Unexpected format for cloud capabilities", str(cm.exception))
-    
-    def test_constructor_no_gateway_verbose(self):
-        """Test constructor with no gateway set and verbose mode."""
-        config_no_gateway = Mock()
-        config_no_gateway.apikey = "test-api-key"
-        config_no_gateway.channel = "test-channel"
-        config_no_gateway.region = "test-region"
-        config_no_gateway.gateway = None
-        
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = config_no_gateway
-            
-            with patch('builtins.print') as mock_print:
-                explorer = AtlasExplorer(verbose=True)
-                
-                # Should print warning about gateway not set
-                mock_print.assert_called_with("Warning: Gateway is not set. Skipping worker status check.")
+        self.mock_get.assert_called_once()
+        self.assertEqual(self.explorer.versionCaps["version"], "0.0.95")
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_check_worker_status_verbose_output(self, mock_get):
-        """Test _check_worker_status with verbose output."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"status": True, "workers": 5}
-        mock_get.return_value = mock_response
+    def test_getCloudCaps_honors_no_store(self):
+        """Test _getCloudCaps does not cache a ``no-store`` response."""
+        self.mock_get.return_value = _Resp(_CHANNEL_CAPS_AROUND_V97, headers={"Cache-Control": "no-store"})
         
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status', return_value={"status": True, "workers": 5}):
-                with patch('builtins.print') as mock_print:
-                    explorer = AtlasExplorer(verbose=True)
-                    
-                    # Get the actual worker status method and test it
-                    with patch('atlasexplorer.core.client.requests.get', return_value=mock_response):
-                        status = AtlasExplorer._check_worker_status(explorer)
-                        
-                        self.assertEqual(status, {"status": True, "workers": 5})
-    
-    @patch('atlasexplorer.core.client.requests.get')  
-    def test_getCloudCaps_successful_version_match(self, mock_get):
-        """Test _getCloudCaps with successful version match."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = [
-            {"version": "0.0.95", "features": ["feature1"]},
-            {"version": "0.0.97", "features": ["feature2", "feature3"]},
-            {"version": "0.0.98", "features": ["feature4"]},
-        ]
-        mock_get.return_value = mock_response
+        self.explorer._getCloudCaps("0.0.97")
+        self.explorer._getCloudCaps("0.0.97")
         
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                
-                explorer._getCloudCaps("0.0.97")
-                
-                # Should set versionCaps to the matching version
-                self.assertEqual(explorer.versionCaps, {"version": "0.0.97", "features": ["feature2", "feature3"]})
-                self.assertEqual(explorer.channelCaps, mock_response.json.return_value)
+        self.assertEqual(self.mock_get.call_count, 2)
     
     def test_getCoreInfo_no_shinro_section(self):
         """Test getCoreInfo when shinro section is missing."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                explorer.versionCaps = {"version": "0.0.97", "other": "data"}  # No shinro section
-                
-                with self.assertRaises(NetworkError) as cm:
-                    explorer.getCoreInfo("I8500")
-                
-                self.assertIn("No 'shinro' section found", str(cm.exception))
+        self.explorer.versionCaps = _VERSION_CAPS_NO_SHINRO
+        
+        with self.assertRaises(NetworkError) as cm:
+            self.explorer.getCoreInfo("I8500")
+        
+        self.assertEqual(cm.exception.message, "No 'shinro' section found in cloud capabilities")
     
     def test_getCoreInfo_invalid_arches_format(self):
         """Test getCoreInfo when arches is not a list."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                explorer.versionCaps = {
-                    "version": "0.0.97", 
-                    "shinro": {"arches": "not_a_list"}  # Invalid format
-                }
-                
-                with self.assertRaises(NetworkError) as cm:
-                    explorer.getCoreInfo("I8500")
-                
-                self.assertIn("Invalid architecture list", str(cm.exception))
+        self.explorer.versionCaps = _VERSION_CAPS_BAD_ARCHES
+        
+        with self.assertRaises(NetworkError) as cm:
+            self.explorer.getCoreInfo("I8500")
+        
+        self.assertEqual(cm.exception.message, "Invalid architecture list in cloud capabilities")
     
     def test_getCoreInfo_core_not_found(self):
         """Test getCoreInfo when requested core is not supported."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_atlas_config:
-            mock_atlas_config.return_value = self.mock_config
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                explorer.versionCaps = {
-                    "version": "0.0.97",
-                    "shinro": {
-                        "arches": [
-                            {"name": "I7500", "features": ["feature1"]},
-                            {"name": "M7500", "features": ["feature2"]},
-                        ]
-                    }
-                }
-                
-                with self.assertRaises(NetworkError) as cm:
-                    explorer.getCoreInfo("UNSUPPORTED_CORE")
-                
-                self.assertIn("Core UNSUPPORTED_CORE is not supported", str(cm.exception))
-
-
-class TestAtlasExplorerCompleteCoverage(unittest.TestCase):
-    """Final coverage tests to reach 90%+ for client.py"""
-    
-    def setUp(self):
-        """Set up test fixtures"""
-        self.mock_config = Mock()
-        self.mock_config.apikey = "test_api_key"
-        self.mock_config.channel = "test_channel"
-        self.mock_config.region = "test_region"  # Set as string, not Mock
-        self.mock_config.gateway = "https://test-gateway.com"
-        
-    @patch('atlasexplorer.core.client.AtlasConfig')
-    def test_getCloudCaps_generic_exception(self, mock_config):
-        """Test generic exception handling in _getCloudCaps (line 109)"""
-        mock_config.return_value = self.mock_config
-        
-        with patch('atlasexplorer.core.client.requests.get') as mock_get:
-            # Simulate a generic exception (not requests.RequestException)
-            mock_get.side_effect = ValueError("Generic error")
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                # The exception should be caught and converted to NetworkError
-                with self.assertRaises(NetworkError) as cm:
-                    explorer._getCloudCaps("1.0.0")  # Pass required version parameter
-                self.assertIn("Generic error", str(cm.exception))
-    
-    @patch('atlasexplorer.core.client.AtlasConfig')
-    def test_getVersionList_no_caps_error(self, mock_config):
-        """Test ConfigurationError in getVersionList when caps not fetched (line 173)"""
-        mock_config.return_value = self.mock_config
+        self.explorer.versionCaps = _VERSION_CAPS_OTHER_ARCHES
         
-        with patch.object(AtlasExplorer, '_check_worker_status'):
-            explorer = AtlasExplorer(verbose=False)
-            explorer.channelCaps = None  # Ensure caps not fetched
-            
-            with self.assertRaises(ConfigurationError) as cm:
-                explorer.getVersionList()
-            
-            self.assertIn("Cloud capabilities not fetched", str(cm.exception))
-    
-    @patch('atlasexplorer.core.client.AtlasConfig')
-    def test_getVersionList_version_extraction(self, mock_config):
-        """Test version extraction logic in getVersionList (line 180)"""
-        mock_config.return_value = self.mock_config
-        
-        with patch.object(AtlasExplorer, '_check_worker_status'):
-            explorer = AtlasExplorer(verbose=False)
-            explorer.channelCaps = [
-                {"version": "1.0.0", "other": "data"},
-                {"version": "2.0.0", "other": "data"},
-                {"no_version": "data"}  # This should be filtered out
-            ]
-            
-            versions = explorer.getVersionList()
-            self.assertEqual(versions, ["1.0.0", "2.0.0"])
+        with self.assertRaises(NetworkError) as cm:
+            self.explorer.getCoreInfo("UNSUPPORTED_CORE")
+        
+        self.assertEqual(cm.exception.message, "Core UNSUPPORTED_CORE is not supported by the cloud capabilities")
     
-    def test_check_worker_status_no_gateway_direct(self):
-        """Test ConfigurationError when gateway not set (lines 194, 197)"""
-        # Create explorer with no gateway set
-        mock_config = Mock()
-        mock_config.apikey = "test_api_key"
-        mock_config.channel = "test_channel"
-        mock_config.region = "test_region"
-        mock_config.gateway = None  # No gateway
-        
-        # Directly instantiate with mocked config (no AtlasConfig patching)
-        explorer = AtlasExplorer.__new__(AtlasExplorer)  # Create without __init__
-        explorer.config = mock_config
-        explorer.verbose = False
-        explorer.channelCaps = None
+    def test_getVersionList_no_caps_error(self):
+        """Test ConfigurationError in getVersionList when caps not fetched (line 173)"""
+        explorer = _bare_explorer(self.mock_config)  # Caps not fetched
         
-        # Now test the method directly
         with self.assertRaises(ConfigurationError) as cm:
-            explorer._check_worker_status()
+            explorer.getVersionList()
         
-        self.assertIn("Gateway is not set", str(cm.exception))
+        self.assertEqual(cm.exception.message, "Cloud capabilities not fetched. Please run _getCloudCaps first.")
     
-    def test_check_worker_status_verbose_and_exception_details(self):
-        """Test verbose output and detailed error handling (lines 213, 218-222, 225-226)"""
-        # Create explorer with gateway set
-        mock_config = Mock()
-        mock_config.apikey = "test_api_key"
-        mock_config.channel = "test_channel"
-        mock_config.region = "test_region"
-        mock_config.gateway = "https://test-gateway.com"
-        
-        # Directly instantiate with mocked config
-        explorer = AtlasExplorer.__new__(AtlasExplorer)  # Create without __init__
-        explorer.config = mock_config
-        explorer.verbose = True  # Enable verbose output
-        explorer.channelCaps = None
-        
-        # Test JSON decode error (line 225-226)
-        with patch('atlasexplorer.core.client.requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.return_value = None  # HTTP success
-            mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-            mock_get.return_value = mock_response
-            
-            with patch('builtins.print') as mock_print:
-                with self.assertRaises(NetworkError) as cm:
-                    explorer._check_worker_status()
-                
-                # Check verbose output (line 213)
-                mock_print.assert_called_with("Checking worker status...")
-                # JSONDecodeError is caught by the general Exception handler (line 224)
-                self.assertIn("Error checking worker status", str(cm.exception))
+    def test_getVersionList_version_extraction(self):
+        """Test version extraction logic in getVersionList (line 180)"""
+        explorer = _bare_explorer(self.mock_config, channelCaps=_CHANNEL_CAPS_WITH_UNVERSIONED)
         
-        # Test request exception with response details (lines 218-222)
-        with patch('atlasexplorer.core.client.requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 500
-            mock_response.text = "Internal Server Error"
-            
-            exception = requests.RequestException("Request failed")
-            exception.response = mock_response
-            mock_get.side_effect = exception
-            
-            with self.assertRaises(NetworkError) as cm:
-                explorer._check_worker_status()
-            
-            error_msg = str(cm.exception)
-            self.assertIn("Error checking worker status", error_msg)
-            self.assertIn("Status: 500", error_msg)
-            self.assertIn("Internal Server Error", error_msg)
+        versions = explorer.getVersionList()
+        self.assertEqual(versions, ["1.0.0", "2.0.0"])
     
-    @patch('atlasexplorer.core.client.AtlasConfig')
-    def test_getSignedUrls_no_gateway_error(self, mock_config):
+    def test_getSignedUrls_no_gateway_error(self):
         """Test ConfigurationError when gateway not configured (line 245)"""
-        # Create a mock config with no gateway
-        mock_config_instance = Mock()
-        mock_config_instance.apikey = "test_api_key"
-        mock_config_instance.channel = "test_channel"
-        mock_config_instance.region = "test_region"
-        mock_config_instance.gateway = None  # No gateway set
-        mock_config.return_value = mock_config_instance
-        
-        with patch.object(AtlasExplorer, '_check_worker_status'):
-            explorer = AtlasExplorer(verbose=False)
-            
-            with self.assertRaises(ConfigurationError) as cm:
-                explorer.getSignedUrls("test-uuid", "test-name", "test-core")
-            
-            self.assertIn("Gateway is not configured", str(cm.exception))
+        # Create a stub config with no gateway
+        config = dataclasses.replace(self.mock_config, gateway=None)
+        
+        explorer = _bare_explorer(config)
+        with self.assertRaises(ConfigurationError) as cm:
+            explorer.getSignedUrls("test-uuid", "test-name", "test-core")
+        
+        self.assertEqual(cm.exception.message, "Gateway is not configured")
     
-    @patch('atlasexplorer.core.client.AtlasConfig')
-    @patch('atlasexplorer.core.client.requests.post')
-    def test_getSignedUrls_request_exception_with_response(self, mock_post, mock_config):
+    def test_getSignedUrls_request_exception_with_response(self):
         """Test request exception handling in getSignedUrls (lines 262-268)"""
-        mock_config.return_value = self.mock_config
+        self.mock_post.return_value = _Resp(status_code=403, text="Forbidden")
         
-        # Mock response with status code and text
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_response.text = "Forbidden"
-        
-        exception = requests.RequestException("Request failed")
-        exception.response = mock_response
-        mock_post.side_effect = exception
+        explorer = _bare_explorer(self.mock_config)
+        with self.assertRaises(NetworkError) as cm:
+            explorer.getSignedUrls("test-uuid", "test-name", "test-core")
         
-        with patch.object(AtlasExplorer, '_check_worker_status'):
-            explorer = AtlasExplorer(verbose=False)
-            
-            with self.assertRaises(NetworkError) as cm:
-                explorer.getSignedUrls("test-uuid", "test-name", "test-core")
-            
-            error_msg = str(cm.exception)
-            self.assertIn("Error fetching signed URLs", error_msg)
-            self.assertIn("Status: 403", error_msg)
-            self.assertIn("Forbidden", error_msg)
-    
-    @patch('atlasexplorer.core.client.AtlasConfig')
-    @patch('atlasexplorer.core.client.requests.post')
-    def test_getSignedUrls_generic_exception(self, mock_post, mock_config):
+        error_msg = str(cm.exception)
+        self.assertIn("Error fetching signed URLs", error_msg)
+        self.assertIn("Status: 403", error_msg)
+        self.assertIn("Forbidden", error_msg)
+    
+    def test_getSignedUrls_generic_exception(self):
         """Test generic exception handling in getSignedUrls (line 268)"""
-        mock_config.return_value = self.mock_config
-        
         # Simulate a generic exception (not requests.RequestException)
-        mock_post.side_effect = ValueError("Generic error")
+        self.mock_post.side_effect = ValueError("Generic error")
         
-        with patch.object(AtlasExplorer, '_check_worker_status'):
-            explorer = AtlasExplorer(verbose=False)
-            
-            with self.assertRaises(NetworkError) as cm:
-                explorer.getSignedUrls("test-uuid", "test-name", "test-core")
-            
-            self.assertIn("Error fetching signed URLs: Generic error", str(cm.exception))
+        explorer = _bare_explorer(self.mock_config)
+        with self.assertRaises(NetworkError) as cm:
+            explorer.getSignedUrls("test-uuid", "test-name", "test-core")
+        
+        self.assertEqual(cm.exception.message, "Error fetching signed URLs: Generic error")
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_get_channel_list_auth_error_and_json_error(self, mock_get):
+    def test_get_channel_list_auth_error_and_json_error(self):
         """Test authentication error and JSON decode error in get_channel_list (lines 300-304, 306)"""
-        from atlasexplorer.core.client import get_channel_list
-        
         # Test 401 authentication error
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.text = "Unauthorized"
-        
-        exception = requests.RequestException("Auth failed")
-        exception.response = mock_response
-        mock_get.side_effect = exception
+        self.mock_get.return_value = _RESP_401
         
         with self.assertRaises(AuthenticationError) as cm:
             get_channel_list("invalid_key")
         
-        self.assertIn("Invalid API key", str(cm.exception))
-        
-        # Reset mock for second test
-        mock_get.reset_mock()
-        mock_get.side_effect = None
+        self.assertEqual(cm.exception.message, "Invalid API key")
         
         # Test JSON decode error
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None  # HTTP success
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _RESP_BAD_JSON
         
         with self.assertRaises(NetworkError) as cm:
             get_channel_list("valid_key")
         
         self.assertIn("Invalid JSON response", str(cm.exception))
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_get_channel_list_other_http_errors(self, mock_get):
+    def test_get_channel_list_other_http_errors(self):
         """Test other HTTP error handling in get_channel_list (lines 300-304)"""
-        from atlasexplorer.core.client import get_channel_list
-        
         # Test 500 server error
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        
-        exception = requests.RequestException("Server error")
-        exception.response = mock_response
-        mock_get.side_effect = exception
+        self.mock_get.return_value = _RESP_500
         
         with self.assertRaises(NetworkError) as cm:
             get_channel_list("valid_key")
@@ -762,186 +606,329 @@ class TestAtlasExplorerCompleteCoverage(unittest.TestCase):
         self.assertIn("500", error_msg)
         self.assertIn("Internal Server Error", error_msg)
     
-    def test_validate_user_api_key_exception_handling(self):
-        """Test exception handling in validate_user_api_key (line 328) - returns False by design"""
-        from atlasexplorer.core.client import validate_user_api_key
+    def test_error_messages_truncate_long_bodies(self):
+        """Test a long error page is cut to 512 characters in the message."""
+        self.mock_post.return_value = _Resp(status_code=502, text="x" * 5000)
         
-        # Test that generic exceptions are caught and return False (this is by design)
-        with patch('atlasexplorer.core.client.requests.get') as mock_get:
-            # Simulate a generic exception (not requests.RequestException)
-            mock_get.side_effect = ValueError("Generic error")
-            
-            # The function should catch the exception and return False, not raise
-            result = validate_user_api_key("test_key")
-            self.assertFalse(result)
+        with self.assertRaises(NetworkError) as cm:
+            self.explorer.getSignedUrls("test-uuid", "test-name", "test-core")
+        
+        self.assertEqual(cm.exception.message.partition("Text: ")[2], "x" * 512 + "...)")
 
 
-class TestAtlasExplorerMissingCoverage(unittest.TestCase):
-    """Additional tests to cover missing lines."""
+class TestAtlasExplorerWorkerStatus(_MockedHTTPTestCase):
+    """Test cases for the real worker status check."""
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_getCloudCaps_general_exception_direct_call(self, mock_get):
-        """Test _getCloudCaps with general exception via direct call."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_config:
-            mock_config.return_value.hasConfig = True
-            mock_config.return_value.apikey = "test_key"
-            mock_config.return_value.channel = "test_channel"
-            mock_config.return_value.region = "test_region"
-            mock_config.return_value.gateway = "https://test.com"
-            
-            # Mock worker status to succeed
-            worker_response = Mock()
-            worker_response.json.return_value = {"status": True}
-            worker_response.raise_for_status.return_value = None
-            
-            # Mock capabilities to succeed initially for constructor
-            caps_response = Mock()
-            caps_response.json.return_value = [{"version": "1.0", "features": []}]
-            caps_response.raise_for_status.return_value = None
+    mock_config = _TEMPLATE_CONFIG
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        swap_attr(self, _client, 'AtlasConfig', lambda **kwargs: self.mock_config)
+    
+    def test_check_worker_status_success(self):
+        """Test successful worker status check."""
+        swap_attr(self, _client._session, 'get', lambda url, **kwargs: _RESP_WORKERS_UP)
+        
+        explorer = AtlasExplorer(verbose=False)
+        status = explorer._check_worker_status()
+        
+        self.assertTrue(status["status"])
+        self.assertEqual(status["workers"], 5)
+    
+    def test_check_worker_status_error(self):
+        """Test worker status check with error."""
+        def failing_get(url, **kwargs):
+            raise _CONN_ERROR
+        
+        swap_attr(self, _client._session, 'get', failing_get)
+        
+        # The constructor will call _check_worker_status() and raise NetworkError
+        with self.assertRaises(NetworkError):
+            AtlasExplorer(verbose=False)
+    
+    def test_check_worker_status_verbose_output(self):
+        """Test _check_worker_status with verbose output."""
+        swap_attr(self, _client._session, 'get', lambda url, **kwargs: _RESP_WORKERS_UP)
+        
+        # Skip __init__ so the status check only runs once, below
+        explorer = _bare_explorer(self.mock_config, verbose=True)
+        
+        with patch('builtins.print') as mock_print:
+            status = explorer._check_worker_status()
+        
+        self.assertEqual(status, {"status": True, "workers": 5})
+        mock_print.assert_any_call("Checking worker status...")
+        mock_print.assert_any_call("Worker status response: {'status': True, 'workers': 5}")
+    
+    def test_constructor_does_not_fetch_cloud_caps(self):
+        """Test the constructor only checks worker status; capabilities stay lazy."""
+        self.mock_get.side_effect = lambda url, **kwargs: (
+            _RESP_CAPS_V97 if url.endswith("/cloudcaps") else _RESP_WORKERS_UP
+        )
+        
+        explorer = AtlasExplorer(verbose=False)
+        
+        self.assertIsNone(explorer.channelCaps)
+        self.assertEqual(self.mock_get.call_count, 1)
+        self.assertTrue(self.mock_get.call_args[0][0].endswith("/dataworkerstatus"))
+    
+    def test_check_worker_status_no_gateway_direct(self):
+        """Test ConfigurationError when gateway not set (lines 194, 197)"""
+        # Create explorer with no gateway set
+        # Directly instantiate with a stub config (no AtlasConfig patching)
+        explorer = _bare_explorer(dataclasses.replace(self.mock_config, gateway=None))
+        
+        # Now test the method directly
+        with self.assertRaises(ConfigurationError) as cm:
+            explorer._check_worker_status()
+        
+        self.assertEqual(cm.exception.message, "Gateway is not set. Cannot check worker status.")
+    
+    def test_check_worker_status_verbose_and_exception_details(self):
+        """Test verbose output and detailed error handling (lines 213, 218-222, 225-226)"""
+        # Directly instantiate with the gateway-enabled stub config
+        explorer = _bare_explorer(self.mock_config, verbose=True)  # Enable verbose output
+        
+        # Test JSON decode error (line 225-226)
+        self.mock_get.return_value = _RESP_BAD_JSON
+        
+        with patch('builtins.print') as mock_print:
+            with self.assertRaises(NetworkError) as cm:
+                explorer._check_worker_status()
             
-            def side_effect(*args, **kwargs):
-                if "cloudcaps" in args[0]:
-                    return caps_response
+            # Check verbose output (line 213)
+            mock_print.assert_called_with("Checking worker status...")
+            # JSONDecodeError is caught by the general Exception handler (line 224)
+            self.assertIn("Error checking worker status", str(cm.exception))
+        
+        # Test request exception with response details (lines 218-222)
+        self.mock_get.return_value = _RESP_500
+        
+        with self.assertRaises(NetworkError) as cm:
+            explorer._check_worker_status()
+        
+        error_msg = str(cm.exception)
+        self.assertIn("Error checking worker status", error_msg)
+        self.assertIn("Status: 500", error_msg)
+        self.assertIn("Internal Server Error", error_msg)
+
+
+class TestHelperFunctions(_MockedHTTPTestCase):
+    """Test cases for helper functions."""
+    
+    def test_get_channel_list_success(self):
+        """Test successful channel list retrieval."""
+        self.mock_get.return_value = _RESP_CHANNEL_LIST
+        
+        result = get_channel_list("test-api-key")
+        
+        self.assertEqual(len(result["channels"]), 2)
+        self.assertEqual(result["channels"][0]["name"], "production")
+    
+    def test_get_channel_list_cached_per_apikey(self):
+        """Test channel lists are cached per API key unless max-age is 0."""
+        self.mock_get.return_value = _RESP_CHANNEL_LIST
+        
+        get_channel_list("test-api-key")
+        get_channel_list("test-api-key")
+        get_channel_list("other-api-key")
+        self.assertEqual(self.mock_get.call_count, 2)
+        
+        self.mock_get.return_value = _Resp(_CHANNEL_LIST_PAYLOAD, headers={"Cache-Control": "max-age=0"})
+        get_channel_list("uncached-key")
+        get_channel_list("uncached-key")
+        self.assertEqual(self.mock_get.call_count, 4)
+    
+    def test_get_channel_list_errors(self):
+        """Test channel list retrieval with authentication and network errors."""
+        cases = [
+            (_RESP_401, AuthenticationError),
+            (_CONN_ERROR, NetworkError),
+        ]
+        for outcome, expected_error in cases:
+            with self.subTest(expected_error=expected_error.__name__):
+                if isinstance(outcome, Exception):
+                    self.mock_get.side_effect = outcome
                 else:
-                    return worker_response
-            
-            mock_get.side_effect = side_effect
-            
-            # Create explorer successfully
-            explorer = AtlasExplorer(verbose=False)
-            
-            # Now mock the get call to raise a general exception for direct call
-            mock_get.side_effect = ValueError("General error")
-            
-            # Call _getCloudCaps directly to trigger the general exception (line 109)
-            with self.assertRaises(NetworkError) as context:
-                explorer._getCloudCaps("2.0")
-            
-            self.assertIn("Error fetching cloud capabilities: General error", str(context.exception))
+                    self.mock_get.side_effect = None
+                    self.mock_get.return_value = outcome
+                
+                with self.assertRaises(expected_error):
+                    get_channel_list("test-api-key")
+    
+    # (label, response or exception from session.head and session.get, expected result)
+    _VALIDATE_CASES = (
+        ("200 OK", _RESP_OK, True),
+        ("401 Unauthorized", _RESP_401, False),
+        ("connection error", _CONN_ERROR, False),
+        # Errors outside requests are swallowed too (line 328)
+        ("unexpected error", ValueError("General error"), False),
+    )
+    
+    def test_validate_user_api_key(self):
+        """Test API key validation for valid, invalid and unreachable cases."""
+        for label, outcome, expected in self._VALIDATE_CASES:
+            with self.subTest(label):
+                for mock in (self.mock_head, self.mock_get):
+                    if isinstance(outcome, Exception):
+                        mock.side_effect = outcome
+                    else:
+                        mock.side_effect = None
+                        mock.return_value = outcome
+                
+                self.assertEqual(validate_user_api_key("test-api-key"), expected)
+    
+    def test_validate_user_api_key_head_ok_skips_get(self):
+        """Test a 200 HEAD response settles validation without a GET."""
+        self.mock_head.return_value = _RESP_OK
+        
+        self.assertTrue(validate_user_api_key("test-api-key"))
+        
+        self.mock_get.assert_not_called()
+    
+    def test_validate_user_api_key_head_rejected(self):
+        """Test API key validation falls back to a streamed GET when HEAD is not 200."""
+        for status in (403, 404, 405, 501):
+            with self.subTest(status=status):
+                self.mock_get.reset_mock()
+                self.mock_head.return_value = _Resp(status_code=status, text="Rejected")
+                self.mock_get.return_value = _RESP_OK
+                
+                self.assertTrue(validate_user_api_key("test-api-key"))
+                
+                self.assertTrue(self.mock_get.call_args.kwargs["stream"])
+
+
+class TestDecodeJson(unittest.TestCase):
+    """Test cases for response body decoding (orjson when installed)."""
+    
+    @staticmethod
+    def _response(body):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        return response
+    
+    def test_decode_json_body(self):
+        """Test a real response body decodes with either JSON backend."""
+        self.assertEqual(_client._decode_json(self._response(b'{"channels": [1, 2]}')), {"channels": [1, 2]})
+    
+    def test_decode_json_invalid_body(self):
+        """Test invalid JSON raises the stdlib JSONDecodeError with either backend."""
+        with self.assertRaises(JSONDecodeError):
+            _client._decode_json(self._response(b"not json"))
+    
+    def test_decode_json_stub_without_content(self):
+        """Test responses without a byte body fall back to ``json()``."""
+        self.assertIs(_client._decode_json(_RESP_CHANNEL_LIST), _CHANNEL_LIST_PAYLOAD)
+
+
+class TestSharedSession(unittest.TestCase):
+    """Test cases for the pooled session the client builds."""
+    
+    def test_session_retries_transient_failures_only(self):
+        """Test the session adapter retries idempotent 5xx errors but not auth failures."""
+        session = _client._build_session()
+        self.addCleanup(session.close)
+        retry = session.get_adapter("https://gateway.example.com").max_retries
+        
+        self.assertEqual(retry.total, 3)
+        self.assertEqual(retry.backoff_factor, 0.25)
+        self.assertTrue(retry.is_retry("GET", 503))
+        self.assertFalse(retry.is_retry("POST", 503))
+        self.assertFalse(retry.is_retry("GET", 401))
+        self.assertFalse(retry.is_retry("POST", 403))
+        self.assertFalse(retry.raise_on_status)
+
+
+class TestAtlasExplorerMissingCoverage(_MockedHTTPTestCase):
+    """Additional tests to cover missing lines."""
+    
+    mock_config = _StubConfig(
+        hasConfig=True,
+        apikey="test_key",
+        channel="test_channel",
+        region="test_region",
+        gateway="https://test.com",
+    )
+    
+    @classmethod
+    def setUpClass(cls):
+        """Patch AtlasConfig once for the whole class."""
+        super().setUpClass()
+        patcher = patch.object(_client, 'AtlasConfig', return_value=cls.mock_config)
+        cls.mock_atlas_config = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+    
+    def setUp(self):
+        """Reset the class-level patches."""
+        super().setUp()
+        self.mock_atlas_config.reset_mock()
     
     def test_getVersionList_returns_version_list(self):
         """Test getVersionList returning version list when channelCaps is list."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_config:
-            mock_config.return_value.hasConfig = True
-            mock_config.return_value.apikey = "test_key"
-            mock_config.return_value.channel = "test_channel"
-            mock_config.return_value.region = "test_region"
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                
-                # Manually set channelCaps to a list to trigger line 178
-                explorer.channelCaps = [
-                    {"version": "1.0", "features": []},
-                    {"version": "2.0", "features": []},
-                    {"data": "no_version"}  # Entry without version
-                ]
-                
-                # Call getVersionList to trigger line 178
-                versions = explorer.getVersionList()
-                
-                # Should return list of versions (line 178)
-                self.assertEqual(versions, ["1.0", "2.0"])
+        # Set channelCaps to a list to trigger line 178
+        explorer = _bare_explorer(self.mock_config, channelCaps=_CHANNEL_CAPS_WITH_UNVERSIONED)
+        
+        # Call getVersionList to trigger line 178
+        versions = explorer.getVersionList()
+        
+        # Should return list of versions (line 178)
+        self.assertEqual(versions, ["1.0.0", "2.0.0"])
     
     def test_getVersionList_returns_empty_list(self):
         """Test getVersionList returning empty list when channelCaps is not a list."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_config:
-            mock_config.return_value.hasConfig = True
-            mock_config.return_value.apikey = "test_key"
-            mock_config.return_value.channel = "test_channel"
-            mock_config.return_value.region = "test_region"
-            
-            with patch.object(AtlasExplorer, '_check_worker_status'):
-                explorer = AtlasExplorer(verbose=False)
-                
-                # Set channelCaps to a dict (not a list) to trigger line 180
-                explorer.channelCaps = {"version": "1.0", "features": []}
-                
-                # Call getVersionList to trigger line 180
-                versions = explorer.getVersionList()
-                
-                # Should return empty list (line 180)
-                self.assertEqual(versions, [])
+        # Set channelCaps to a dict (not a list) to trigger line 180
+        explorer = _bare_explorer(self.mock_config, channelCaps={"version": "1.0", "features": []})
+        
+        # Call getVersionList to trigger line 180
+        versions = explorer.getVersionList()
+        
+        # Should return empty list (line 180)
+        self.assertEqual(versions, [])
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_check_worker_status_verbose_print(self, mock_get):
+    def test_check_worker_status_verbose_print(self):
         """Test _check_worker_status with verbose output."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_config:
-            mock_config.return_value.hasConfig = True
-            mock_config.return_value.apikey = "test_key"
-            mock_config.return_value.channel = "test_channel"
-            mock_config.return_value.region = "test_region"
-            
-            mock_response = Mock()
-            mock_response.raise_for_status.return_value = None
-            mock_response.json.return_value = {"status": True, "workers": 5}
-            mock_get.return_value = mock_response
+        self.mock_get.return_value = _RESP_WORKERS_UP
+        
+        with patch('builtins.print') as mock_print:
+            explorer = AtlasExplorer(verbose=True)  # Enable verbose mode
             
-            with patch('builtins.print') as mock_print:
-                explorer = AtlasExplorer(verbose=True)  # Enable verbose mode
-                
-                # Verify that the verbose print was called (line 213)
-                mock_print.assert_any_call("Worker status response: {'status': True, 'workers': 5}")
+            # Verify that the verbose print was called (line 213)
+            mock_print.assert_any_call("Worker status response: {'status': True, 'workers': 5}")
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_check_worker_status_json_decode_error(self, mock_get):
+    def test_check_worker_status_json_decode_error(self):
         """Test _check_worker_status with JSON decode error."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_config:
-            mock_config.return_value.hasConfig = True
-            mock_config.return_value.apikey = "test_key"
-            mock_config.return_value.channel = "test_channel"
-            mock_config.return_value.region = "test_region"
-            
-            mock_response = Mock()
-            mock_response.raise_for_status.return_value = None
-            mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-            mock_get.return_value = mock_response
-            
-            with self.assertRaises(NetworkError) as context:
-                AtlasExplorer(verbose=False)
-            
-            self.assertIn("Error checking worker status: Invalid JSON", str(context.exception))
+        self.mock_get.return_value = _RESP_BAD_JSON
+        
+        with self.assertRaises(NetworkError) as context:
+            AtlasExplorer(verbose=False)
+        
+        self.assertIn("Error checking worker status: Invalid JSON", str(context.exception))
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_check_worker_status_general_exception(self, mock_get):
+    def test_check_worker_status_general_exception(self):
         """Test _check_worker_status with general exception."""
-        with patch('atlasexplorer.core.client.AtlasConfig') as mock_config:
-            mock_config.return_value.hasConfig = True
-            mock_config.return_value.apikey = "test_key"
-            mock_config.return_value.channel = "test_channel"
-            mock_config.return_value.region = "test_region"
-            
-            # Simulate a general exception (not RequestException)
-            mock_get.side_effect = ValueError("General error")
-            
-            with self.assertRaises(NetworkError) as context:
-                AtlasExplorer(verbose=False)
-            
-            self.assertIn("Error checking worker status: General error", str(context.exception))
+        # Simulate a general exception (not RequestException)
+        self.mock_get.side_effect = ValueError("General error")
+        
+        with self.assertRaises(NetworkError) as context:
+            AtlasExplorer(verbose=False)
+        
+        self.assertEqual(context.exception.message, "Error checking worker status: General error")
     
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_get_channel_list_network_error_no_response(self, mock_get):
+    def test_get_channel_list_network_error_no_response(self):
         """Test get_channel_list with RequestException having no response."""
         # Create a RequestException without response
         request_error = requests.exceptions.RequestException("Network error")
         # Ensure no response attribute
-        mock_get.side_effect = request_error
+        self.mock_get.side_effect = request_error
         
         with self.assertRaises(NetworkError) as context:
             get_channel_list("test_key")
         
         # This should trigger line 302 (RequestException without response)
-        self.assertIn("Network error fetching channel list: Network error", str(context.exception))
-    
-    @patch('atlasexplorer.core.client.requests.get')
-    def test_validate_user_api_key_general_exception(self, mock_get):
-        """Test validate_user_api_key with general exception."""
-        # Simulate a general exception (not requests.RequestException)
-        mock_get.side_effect = ValueError("General error")
-        
-        # The function should catch the exception and return False (line 328)
-        result = validate_user_api_key("test_key")
-        self.assertFalse(result)
+        self.assertEqual(context.exception.message, "Network error fetching channel list: Network error")
 
 
 if __name__ == '__main__':
@@ -3,6 +3,7 @@ Comprehensive tests for CLI Commands module.
 """
 
 import unittest
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 import argparse
 
@@ -33,9 +34,17 @@ class TestAtlasExplorerCLIInitialization(unittest.TestCase):
             self.assertTrue(hasattr(self.cli, method), f"CLI should have {method} method")
 
     def test_commands_dictionary_setup(self):
-        """Test that the commands dictionary is properly initialized."""
-        self.assertIsInstance(self.cli.commands, dict)
+        """Test that the commands mapping is properly initialized."""
+        self.assertIsInstance(self.cli.commands, MappingProxyType)
         self.assertEqual(self.cli.commands['configure'], self.cli.configure_command)
+        self.assertIs(self.cli.commands, self.cli.commands)
+
+    def test_commands_registry_is_read_only(self):
+        """Test that commands cannot be added or replaced at runtime."""
+        with self.assertRaises(TypeError):
+            self.cli.commands['configure'] = Mock()
+        with self.assertRaises(TypeError):
+            AtlasExplorerCLI._COMMANDS['exec'] = 'configure_command'
 
 
 class TestAtlasExplorerCLICommandExecution(unittest.TestCase):
@@ -155,7 +164,7 @@ class TestAtlasExplorerCLICommandExecution(unittest.TestCase):
             raise ValueError(error_message)
         
         # Replace the configure command with our failing version
-        self.cli.commands["configure"] = failing_command
+        self.cli.configure_command = failing_command
         
         with patch('sys.exit') as mock_exit:
             mock_exit.side_effect = SystemExit  # Make exit actually exit
@@ -248,6 +257,10 @@ class TestAtlasExplorerCLIArgumentParser(unittest.TestCase):
         # Should have subparsers
         self.assertTrue(hasattr(parser, '_subparsers'))
 
+    def test_create_parser_is_cached(self):
+        """Test that the parser is built once and reused."""
+        self.assertIs(AtlasExplorerCLI.create_parser(), AtlasExplorerCLI.create_parser())
+
 
 class TestAtlasExplorerCLIMainEntry(unittest.TestCase):
     """Test main entry point functionality."""
@@ -389,8 +402,8 @@ class TestAtlasExplorerCLISecurityFeatures(unittest.TestCase):
 
     def test_dictionary_based_dispatch(self):
         """Test that command dispatch uses dictionary lookup, not eval."""
-        # Verify that commands are stored in a dictionary
-        self.assertIsInstance(self.cli.commands, dict)
+        # Verify that commands are stored in a read-only mapping
+        self.assertIsInstance(self.cli.commands, MappingProxyType)
         self.assertIn('configure', self.cli.commands)
         
         # Verify that the configure command points to the method
@@ -11,10 +11,37 @@ import tempfile
 import os
 import json
 from pathlib import Path
+from types import SimpleNamespace
 
+import requests
+
+import atlasexplorer.core.config
 from atlasexplorer.core.config import AtlasConfig
 from atlasexplorer.core.constants import AtlasConstants
 from atlasexplorer.utils.exceptions import ConfigurationError, NetworkError
+from helpers import swap_attr
+
+
+_NO_CONFIG_FILE = Path("/non/existent/config.json")
+
+
+def _raise_invalid_json():
+    raise ValueError("Invalid JSON")
+
+
+# Canned gateway replies shared by reference; nothing in AtlasConfig mutates them.
+_GATEWAY_OK = SimpleNamespace(
+    raise_for_status=lambda: None,
+    json=lambda: {"endpoint": "https://test-gateway.example.com"},
+)
+_GATEWAY_NO_ENDPOINT = SimpleNamespace(
+    raise_for_status=lambda: None,
+    json=lambda: {"invalid": "response"},
+)
+_GATEWAY_BAD_JSON = SimpleNamespace(raise_for_status=lambda: None, json=_raise_invalid_json)
+_GATEWAY_HTTP_401 = requests.HTTPError(
+    "HTTP 401", response=SimpleNamespace(status_code=401, text="Unauthorized")
+)
 
 
 class TestAtlasConfigInitialization(unittest.TestCase):
@@ -22,27 +49,30 @@ class TestAtlasConfigInitialization(unittest.TestCase):
 
     def test_initialization_default_parameters(self):
         """Test default initialization parameters."""
+        swap_attr(self, AtlasConfig, '_get_config_file_path', lambda self: _NO_CONFIG_FILE)
         with patch.dict(os.environ, {}, clear=True):
-            with patch.object(AtlasConfig, '_get_config_file_path') as mock_get_path:
-                mock_get_path.return_value = Path("/non/existent/config.json")
-                config = AtlasConfig()
-                self.assertTrue(config.verbose)
-                self.assertIsNone(config.gateway)
-                self.assertFalse(config.hasConfig)
+            config = AtlasConfig()
+            self.assertTrue(config.verbose)
+            self.assertIsNone(config.gateway)
+            self.assertFalse(config.hasConfig)
 
     def test_initialization_readonly_true(self):
         """Test initialization with readonly=True."""
-        with patch.object(AtlasConfig, '_load_from_environment', return_value=True):
-            with patch.object(AtlasConfig, '_set_gateway_by_channel_region') as mock_set_gateway:
-                config = AtlasConfig(readonly=True)
-                mock_set_gateway.assert_not_called()
+        mock_set_gateway = MagicMock()
+        swap_attr(self, AtlasConfig, '_load_from_environment', lambda self: True)
+        swap_attr(self, AtlasConfig, '_set_gateway_by_channel_region', mock_set_gateway)
+        
+        AtlasConfig(readonly=True)
+        mock_set_gateway.assert_not_called()
 
     def test_initialization_readonly_false(self):
         """Test initialization with readonly=False (default)."""
-        with patch.object(AtlasConfig, '_load_from_environment', return_value=True):
-            with patch.object(AtlasConfig, '_set_gateway_by_channel_region') as mock_set_gateway:
-                config = AtlasConfig(readonly=False)
-                mock_set_gateway.assert_called_once()
+        mock_set_gateway = MagicMock()
+        swap_attr(self, AtlasConfig, '_load_from_environment', lambda self: True)
+        swap_attr(self, AtlasConfig, '_set_gateway_by_channel_region', mock_set_gateway)
+        
+        AtlasConfig(readonly=False)
+        mock_set_gateway.assert_called_once()
 
     def test_initialization_verbose_false(self):
         """Test initialization with verbose=False."""
@@ -55,24 +85,27 @@ class TestAtlasConfigInitialization(unittest.TestCase):
         channel = "test-channel"
         region = "test-region"
         
-        with patch.object(AtlasConfig, '_load_from_environment', return_value=False):
-            with patch.object(AtlasConfig, '_load_from_config_file', return_value=False):
-                with patch.object(AtlasConfig, '_set_gateway_by_channel_region') as mock_set_gateway:
-                    config = AtlasConfig(apikey=apikey, channel=channel, region=region)
-                    
-                    self.assertEqual(config.apikey, apikey)
-                    self.assertEqual(config.channel, channel)
-                    self.assertEqual(config.region, region)
-                    self.assertTrue(config.hasConfig)
-                    mock_set_gateway.assert_called_once()
+        mock_set_gateway = MagicMock()
+        swap_attr(self, AtlasConfig, '_load_from_environment', lambda self: False)
+        swap_attr(self, AtlasConfig, '_load_from_config_file', lambda self: False)
+        swap_attr(self, AtlasConfig, '_set_gateway_by_channel_region', mock_set_gateway)
+        
+        config = AtlasConfig(apikey=apikey, channel=channel, region=region)
+        
+        self.assertEqual(config.apikey, apikey)
+        self.assertEqual(config.channel, channel)
+        self.assertEqual(config.region, region)
+        self.assertTrue(config.hasConfig)
+        mock_set_gateway.assert_called_once()
 
     def test_initialization_incomplete_parameters(self):
         """Test initialization with incomplete direct parameters."""
-        with patch.object(AtlasConfig, '_load_from_environment', return_value=False):
-            with patch.object(AtlasConfig, '_load_from_config_file', return_value=False):
-                # Missing region parameter
-                config = AtlasConfig(apikey="test-key", channel="test-channel")
-                self.assertFalse(config.hasConfig)
+        swap_attr(self, AtlasConfig, '_load_from_environment', lambda self: False)
+        swap_attr(self, AtlasConfig, '_load_from_config_file', lambda self: False)
+        
+        # Missing region parameter
+        config = AtlasConfig(apikey="test-key", channel="test-channel")
+        self.assertFalse(config.hasConfig)
 
 
 class TestAtlasConfigEnvironmentLoading(unittest.TestCase):
@@ -179,97 +212,86 @@ class TestAtlasConfigExceptionHandling(unittest.TestCase):
 class TestAtlasConfigFileLoading(unittest.TestCase):
     """Test configuration loading from config files."""
 
+    TEST_CONFIG_DATA = {
+        "apikey": "file-api-key",
+        "channel": "file-channel",
+        "region": "file-region"
+    }
+    TEST_CONFIG_BYTES = json.dumps(TEST_CONFIG_DATA).encode()
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one scratch directory for the whole class."""
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.tmp_path = Path(tmp.name)
+
     def setUp(self):
         """Set up test fixtures."""
         self.config = AtlasConfig(readonly=True, verbose=False)
-        self.test_config_data = {
-            "apikey": "file-api-key",
-            "channel": "file-channel",
-            "region": "file-region"
-        }
 
     def test_load_from_config_file_success(self):
         """Test successful loading from config file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            json.dump(self.test_config_data, temp_file)
-            temp_file_path = temp_file.name
-
-        try:
-            with patch.object(self.config, '_get_config_file_path', return_value=Path(temp_file_path)):
-                result = self.config._load_from_config_file()
-                
-                self.assertTrue(result)
-                self.assertEqual(self.config.apikey, "file-api-key")
-                self.assertEqual(self.config.channel, "file-channel")
-                self.assertEqual(self.config.region, "file-region")
-                self.assertTrue(self.config.hasConfig)
-                
-        finally:
-            os.unlink(temp_file_path)
+        config_path = self.tmp_path / f"{self._testMethodName}.json"
+        config_path.write_bytes(self.TEST_CONFIG_BYTES)
+        self.config._get_config_file_path = lambda: config_path
+        
+        result = self.config._load_from_config_file()
+        
+        self.assertTrue(result)
+        self.assertEqual(self.config.apikey, "file-api-key")
+        self.assertEqual(self.config.channel, "file-channel")
+        self.assertEqual(self.config.region, "file-region")
+        self.assertTrue(self.config.hasConfig)
 
     def test_load_from_config_file_missing_file(self):
         """Test loading when config file doesn't exist."""
-        non_existent_path = Path("/non/existent/path/config.json")
+        self.config._get_config_file_path = lambda: _NO_CONFIG_FILE
         
-        with patch.object(self.config, '_get_config_file_path', return_value=non_existent_path):
-            result = self.config._load_from_config_file()
-            self.assertFalse(result)
+        result = self.config._load_from_config_file()
+        self.assertFalse(result)
 
     def test_load_from_config_file_invalid_json(self):
         """Test loading with invalid JSON in config file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            temp_file.write("invalid json content")
-            temp_file_path = temp_file.name
-
-        try:
-            config = AtlasConfig(readonly=True, verbose=True)
+        config_path = self.tmp_path / f"{self._testMethodName}.json"
+        config_path.write_text("invalid json content")
+        config = AtlasConfig(readonly=True, verbose=True)
+        config._get_config_file_path = lambda: config_path
+        
+        with patch('builtins.print') as mock_print:
+            result = config._load_from_config_file()
             
-            with patch.object(config, '_get_config_file_path', return_value=Path(temp_file_path)):
-                with patch('builtins.print') as mock_print:
-                    result = config._load_from_config_file()
-                    
-                    self.assertFalse(result)
-                    mock_print.assert_called()
-                    
-        finally:
-            os.unlink(temp_file_path)
+            self.assertFalse(result)
+            mock_print.assert_called()
 
     def test_load_from_config_file_missing_required_fields(self):
         """Test loading with missing required fields in config file."""
         incomplete_config = {"apikey": "test-key", "channel": "test-channel"}  # Missing region
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            json.dump(incomplete_config, temp_file)
-            temp_file_path = temp_file.name
-
-        try:
-            config = AtlasConfig(readonly=True, verbose=True)
+        config_path = self.tmp_path / f"{self._testMethodName}.json"
+        config_path.write_text(json.dumps(incomplete_config))
+        config = AtlasConfig(readonly=True, verbose=True)
+        config._get_config_file_path = lambda: config_path
+        
+        with patch('builtins.print') as mock_print:
+            result = config._load_from_config_file()
             
-            with patch.object(config, '_get_config_file_path', return_value=Path(temp_file_path)):
-                with patch('builtins.print') as mock_print:
-                    result = config._load_from_config_file()
-                    
-                    self.assertFalse(result)
-                    mock_print.assert_called_with(f"Warning: Missing 'region' in config file {temp_file_path}")
-                    
-        finally:
-            os.unlink(temp_file_path)
+            self.assertFalse(result)
+            mock_print.assert_called_with(f"Warning: Missing 'region' in config file {config_path}")
 
     def test_load_from_config_file_io_error(self):
         """Test loading with IO error during file reading."""
         config = AtlasConfig(readonly=True, verbose=True)
+        mock_path = Mock()
+        mock_path.exists.return_value = True
+        config._get_config_file_path = lambda: mock_path
         
-        with patch.object(config, '_get_config_file_path') as mock_get_path:
-            mock_path = Mock()
-            mock_path.exists.return_value = True
-            mock_get_path.return_value = mock_path
-            
-            with patch('builtins.open', side_effect=IOError("Permission denied")):
-                with patch('builtins.print') as mock_print:
-                    result = config._load_from_config_file()
-                    
-                    self.assertFalse(result)
-                    mock_print.assert_called_with("Error loading config file: Permission denied")
+        with patch('builtins.open', side_effect=IOError("Permission denied")):
+            with patch('builtins.print') as mock_print:
+                result = config._load_from_config_file()
+                
+                self.assertFalse(result)
+                mock_print.assert_called_with("Error loading config file: Permission denied")
 
     def test_get_config_file_path(self):
         """Test config file path generation."""
@@ -285,20 +307,24 @@ class TestAtlasConfigFileLoading(unittest.TestCase):
 class TestAtlasConfigGatewaySetup(unittest.TestCase):
     """Test gateway endpoint setup functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Patch requests.get in the config module once for the whole class."""
+        patcher = patch.object(atlasexplorer.core.config.requests, "get")
+        cls.mock_get = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
     def setUp(self):
         """Set up test fixtures."""
+        self.mock_get.reset_mock(return_value=True, side_effect=True)
+        self.mock_get.return_value = _GATEWAY_OK
         self.config = AtlasConfig(readonly=True, verbose=False)
         self.config.apikey = "test-api-key"
         self.config.channel = "test-channel"
         self.config.region = "test-region"
 
-    @patch('requests.get')
-    def test_set_gateway_by_channel_region_success(self, mock_get):
+    def test_set_gateway_by_channel_region_success(self):
         """Test successful gateway setup."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"endpoint": "https://test-gateway.example.com"}
-        mock_get.return_value = mock_response
-        
         config = AtlasConfig(readonly=True, verbose=True)
         config.apikey = "test-api-key"
         config.channel = "test-channel"
@@ -323,33 +349,21 @@ class TestAtlasConfigGatewaySetup(unittest.TestCase):
             config._set_gateway_by_channel_region()
         
         self.assertIn("Missing required configuration", str(context.exception))
+        self.mock_get.assert_not_called()
 
-    @patch('atlasexplorer.core.config.requests')
-    def test_set_gateway_network_error(self, mock_requests):
+    def test_set_gateway_network_error(self):
         """Test gateway setup with network error."""
-        mock_requests.RequestException = Exception
-        
-        # Create exception without response attribute
-        error = Exception("Connection failed")
-        mock_requests.get.side_effect = error
+        # Connection failures carry no response
+        self.mock_get.side_effect = requests.ConnectionError("Connection failed")
         
         with self.assertRaises(NetworkError) as context:
             self.config._set_gateway_by_channel_region()
         
         self.assertIn("Error connecting to gateway API", str(context.exception))
 
-    @patch('atlasexplorer.core.config.requests')
-    def test_set_gateway_http_error(self, mock_requests):
+    def test_set_gateway_http_error(self):
         """Test gateway setup with HTTP error response."""
-        mock_requests.RequestException = Exception
-        
-        # Create an exception with response attribute
-        error = Exception("HTTP 401") 
-        error.response = Mock()
-        error.response.status_code = 401
-        error.response.text = "Unauthorized"
-        
-        mock_requests.get.side_effect = error
+        self.mock_get.side_effect = _GATEWAY_HTTP_401
         
         with self.assertRaises(NetworkError) as context:
             self.config._set_gateway_by_channel_region()
@@ -359,37 +373,26 @@ class TestAtlasConfigGatewaySetup(unittest.TestCase):
         self.assertIn("Status: 401", error_message)
         self.assertIn("Text: Unauthorized", error_message)
 
-    @patch('requests.get')
-    def test_set_gateway_invalid_response_format(self, mock_get):
+    def test_set_gateway_invalid_response_format(self):
         """Test gateway setup with invalid response format."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"invalid": "response"}  # Missing 'endpoint'
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _GATEWAY_NO_ENDPOINT
         
         with self.assertRaises(ConfigurationError) as context:
             self.config._set_gateway_by_channel_region()
         
         self.assertIn("No 'endpoint' found in response", str(context.exception))
 
-    @patch('requests.get')
-    def test_set_gateway_json_decode_error(self, mock_get):
+    def test_set_gateway_json_decode_error(self):
         """Test gateway setup with JSON decode error."""
-        mock_response = Mock()
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _GATEWAY_BAD_JSON
         
         with self.assertRaises(ConfigurationError) as context:
             self.config._set_gateway_by_channel_region()
         
         self.assertIn("Invalid response from gateway API", str(context.exception))
 
-    @patch('requests.get')
-    def test_set_gateway_request_parameters(self, mock_get):
+    def test_set_gateway_request_parameters(self):
         """Test that gateway setup uses correct request parameters."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"endpoint": "https://test-gateway.example.com"}
-        mock_get.return_value = mock_response
-        
         self.config._set_gateway_by_channel_region()
         
         expected_url = f"{AtlasConstants.AE_GLOBAL_API}/gwbychannelregion"
@@ -399,19 +402,26 @@ class TestAtlasConfigGatewaySetup(unittest.TestCase):
             "region": "test-region",
         }
         
-        mock_get.assert_called_once_with(
-            expected_url, 
-            headers=expected_headers, 
-            timeout=AtlasConstants.HTTP_TIMEOUT
+        self.mock_get.assert_called_once_with(
+            expected_url, headers=expected_headers, timeout=AtlasConstants.HTTP_TIMEOUT
         )
 
 
 class TestAtlasConfigFileSaving(unittest.TestCase):
     """Test configuration file saving functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one scratch directory for the whole class."""
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.tmp_path = Path(tmp.name)
+
     def setUp(self):
         """Set up test fixtures."""
         self.config = AtlasConfig(readonly=True, verbose=False)
+        # save_to_file creates missing parents, so each test gets its own subdirectory
+        self.test_dir = self.tmp_path / self._testMethodName
 
     def test_save_to_file_success(self):
         """Test successful configuration saving."""
@@ -421,72 +431,67 @@ class TestAtlasConfigFileSaving(unittest.TestCase):
             "region": "save-test-region"
         }
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = Path(temp_dir) / "config.json"
-            
-            with patch.object(self.config, '_get_config_file_path', return_value=config_path):
-                self.config.save_to_file(config_data)
-                
-                # Verify file was created and contains correct data
-                self.assertTrue(config_path.exists())
-                with open(config_path) as f:
-                    saved_data = json.load(f)
-                self.assertEqual(saved_data, config_data)
+        config_path = self.test_dir / "config.json"
+        self.config._get_config_file_path = lambda: config_path
+        
+        self.config.save_to_file(config_data)
+        
+        # Verify file was created and contains correct data
+        self.assertTrue(config_path.exists())
+        with open(config_path) as f:
+            saved_data = json.load(f)
+        self.assertEqual(saved_data, config_data)
 
     def test_save_to_file_creates_directory(self):
         """Test that save_to_file creates parent directories."""
         config_data = {"test": "data"}
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = Path(temp_dir) / "nested" / "dir" / "config.json"
-            
-            with patch.object(self.config, '_get_config_file_path', return_value=config_path):
-                self.config.save_to_file(config_data)
-                
-                # Verify directory structure was created
-                self.assertTrue(config_path.parent.exists())
-                self.assertTrue(config_path.exists())
+        config_path = self.test_dir / "nested" / "dir" / "config.json"
+        self.config._get_config_file_path = lambda: config_path
+        
+        self.config.save_to_file(config_data)
+        
+        # Verify directory structure was created
+        self.assertTrue(config_path.parent.exists())
+        self.assertTrue(config_path.exists())
 
     def test_save_to_file_verbose_output(self):
         """Test verbose output during file saving."""
         config = AtlasConfig(readonly=True, verbose=True)
         config_data = {"test": "data"}
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = Path(temp_dir) / "config.json"
-            
-            with patch.object(config, '_get_config_file_path', return_value=config_path):
-                with patch('builtins.print') as mock_print:
-                    config.save_to_file(config_data)
-                    mock_print.assert_called_with(f"Configuration saved to {config_path}")
+        config_path = self.test_dir / "config.json"
+        config._get_config_file_path = lambda: config_path
+        
+        with patch('builtins.print') as mock_print:
+            config.save_to_file(config_data)
+            mock_print.assert_called_with(f"Configuration saved to {config_path}")
 
     def test_save_to_file_io_error(self):
         """Test save_to_file with IO error."""
         config_data = {"test": "data"}
         
-        with patch.object(self.config, '_get_config_file_path') as mock_get_path:
-            mock_path = Mock()
-            mock_path.parent.mkdir.side_effect = OSError("Permission denied")
-            mock_get_path.return_value = mock_path
-            
-            with self.assertRaises(ConfigurationError) as context:
-                self.config.save_to_file(config_data)
-            
-            self.assertIn("Failed to save configuration", str(context.exception))
+        mock_path = Mock()
+        mock_path.parent.mkdir.side_effect = OSError("Permission denied")
+        self.config._get_config_file_path = lambda: mock_path
+        
+        with self.assertRaises(ConfigurationError) as context:
+            self.config.save_to_file(config_data)
+        
+        self.assertIn("Failed to save configuration", str(context.exception))
 
     def test_save_to_file_json_encode_error(self):
         """Test save_to_file with JSON encoding error."""
         # Create data that can't be JSON serialized
         config_data = {"function": lambda x: x}  # Functions can't be JSON serialized
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = Path(temp_dir) / "config.json"
-            
-            with patch.object(self.config, '_get_config_file_path', return_value=config_path):
-                with self.assertRaises(ConfigurationError) as context:
-                    self.config.save_to_file(config_data)
-                
-                self.assertIn("Failed to save configuration", str(context.exception))
+        config_path = self.test_dir / "config.json"
+        self.config._get_config_file_path = lambda: config_path
+        
+        with self.assertRaises(ConfigurationError) as context:
+            self.config.save_to_file(config_data)
+        
+        self.assertIn("Failed to save configuration", str(context.exception))
 
 
 class TestAtlasConfigLegacyMethods(unittest.TestCase):
@@ -496,9 +501,10 @@ class TestAtlasConfigLegacyMethods(unittest.TestCase):
         """Test legacy setGWbyChannelRegion method."""
         config = AtlasConfig(readonly=True, verbose=False)
         
-        with patch.object(config, '_set_gateway_by_channel_region') as mock_method:
-            config.setGWbyChannelRegion()
-            mock_method.assert_called_once()
+        config._set_gateway_by_channel_region = mock_method = MagicMock()
+        
+        config.setGWbyChannelRegion()
+        mock_method.assert_called_once()
 
 
 class TestAtlasConfigIntegrationScenarios(unittest.TestCase):
@@ -517,18 +523,19 @@ class TestAtlasConfigIntegrationScenarios(unittest.TestCase):
             json.dump(file_config, temp_file)
             temp_file_path = temp_file.name
 
+        swap_attr(self, AtlasConfig, '_get_config_file_path', lambda self: Path(temp_file_path))
+        swap_attr(self, AtlasConfig, '_set_gateway_by_channel_region', lambda self: None)
+        
         try:
             with patch.dict(os.environ, {AtlasConstants.CONFIG_ENVAR: "env-key:env-channel:env-region"}):
-                with patch.object(AtlasConfig, '_get_config_file_path', return_value=Path(temp_file_path)):
-                    with patch.object(AtlasConfig, '_set_gateway_by_channel_region'):
-                        config = AtlasConfig()
-                        
-                        # Should use environment values, not file values
-                        self.assertEqual(config.apikey, "env-key")
-                        self.assertEqual(config.channel, "env-channel")
-                        self.assertEqual(config.region, "env-region")
-                        self.assertTrue(config.hasConfig)
-                        
+                config = AtlasConfig()
+                
+                # Should use environment values, not file values
+                self.assertEqual(config.apikey, "env-key")
+                self.assertEqual(config.channel, "env-channel")
+                self.assertEqual(config.region, "env-region")
+                self.assertTrue(config.hasConfig)
+                
         finally:
             os.unlink(temp_file_path)
 
@@ -544,50 +551,49 @@ class TestAtlasConfigIntegrationScenarios(unittest.TestCase):
             json.dump(file_config, temp_file)
             temp_file_path = temp_file.name
 
+        swap_attr(self, AtlasConfig, '_get_config_file_path', lambda self: Path(temp_file_path))
+        swap_attr(self, AtlasConfig, '_set_gateway_by_channel_region', lambda self: None)
+        
         try:
             with patch.dict(os.environ, {}, clear=True):
-                with patch.object(AtlasConfig, '_get_config_file_path', return_value=Path(temp_file_path)):
-                    with patch.object(AtlasConfig, '_set_gateway_by_channel_region'):
-                        config = AtlasConfig()
-                        
-                        # Should use file values
-                        self.assertEqual(config.apikey, "file-key")
-                        self.assertEqual(config.channel, "file-channel")
-                        self.assertEqual(config.region, "file-region")
-                        self.assertTrue(config.hasConfig)
-                        
+                config = AtlasConfig()
+                
+                # Should use file values
+                self.assertEqual(config.apikey, "file-key")
+                self.assertEqual(config.channel, "file-channel")
+                self.assertEqual(config.region, "file-region")
+                self.assertTrue(config.hasConfig)
+                
         finally:
             os.unlink(temp_file_path)
 
     def test_fallback_to_direct_parameters(self):
         """Test fallback to direct parameters when no other config sources available."""
+        swap_attr(self, AtlasConfig, '_get_config_file_path', lambda self: _NO_CONFIG_FILE)
+        swap_attr(self, AtlasConfig, '_set_gateway_by_channel_region', lambda self: None)
+        
         with patch.dict(os.environ, {}, clear=True):
-            with patch.object(AtlasConfig, '_get_config_file_path') as mock_get_path:
-                mock_get_path.return_value = Path("/non/existent/config.json")
-                
-                with patch.object(AtlasConfig, '_set_gateway_by_channel_region'):
-                    config = AtlasConfig(
-                        apikey="direct-key",
-                        channel="direct-channel", 
-                        region="direct-region"
-                    )
-                    
-                    # Should use direct parameters
-                    self.assertEqual(config.apikey, "direct-key")
-                    self.assertEqual(config.channel, "direct-channel")
-                    self.assertEqual(config.region, "direct-region")
-                    self.assertTrue(config.hasConfig)
+            config = AtlasConfig(
+                apikey="direct-key",
+                channel="direct-channel", 
+                region="direct-region"
+            )
+            
+            # Should use direct parameters
+            self.assertEqual(config.apikey, "direct-key")
+            self.assertEqual(config.channel, "direct-channel")
+            self.assertEqual(config.region, "direct-region")
+            self.assertTrue(config.hasConfig)
 
     def test_no_configuration_available(self):
         """Test behavior when no configuration is available from any source."""
+        swap_attr(self, AtlasConfig, '_get_config_file_path', lambda self: _NO_CONFIG_FILE)
+        
         with patch.dict(os.environ, {}, clear=True):
-            with patch.object(AtlasConfig, '_get_config_file_path') as mock_get_path:
-                mock_get_path.return_value = Path("/non/existent/config.json")
-                
-                # No direct parameters provided
-                config = AtlasConfig()
-                
-                self.assertFalse(config.hasConfig)
+            # No direct parameters provided
+            config = AtlasConfig()
+            
+            self.assertFalse(config.hasConfig)
 
 
 if __name__ == '__main__':